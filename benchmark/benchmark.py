@@ -1,7 +1,8 @@
+import random
 import time
 
 from benchmark.csv_to_model import build_model_from_csv
-from solver.constants import QUALITY_ARB, QUALITY_ANTI
+from solver.constants import QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB
 from solver.solver import Solver
 from benchmark.transitive import create_transitive_benchmark
 
@@ -9,6 +10,27 @@ from benchmark.transitive import create_transitive_benchmark
 MAX_STEPS: int = 10
 
 
+def create_ingest_benchmark(amount: int, pairs: int) -> list[list]:
+    """
+    Create the columns of random statements, distributed over a chain of variable pairs
+
+    Parameters:
+        amount (int): amount of statements
+        pairs (int): amount of variable pairs
+
+    Returns:
+        (list[list]): columns of the statements, see Solver.add_columns
+    """
+
+    rng: random.Random = random.Random(0)
+    qualities: list[str] = [QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB]
+    begin: list[float] = [rng.uniform(0, 100) for _ in range(amount)]
+    begin_y: list[float] = [rng.uniform(0, 100) for _ in range(amount)]
+    return [[f"v{i % pairs}" for i in range(amount)], begin, [x + 1 for x in begin],
+            [qualities[i % 4] for i in range(amount)], begin_y, [y + 2 for y in begin_y],
+            [f"v{i % pairs + 1}" for i in range(amount)]]
+
+
 def run_benchmark():
     print("============================== Starting Benchmark... ==============================\n")
     print("< Starting Altitude-Barometer-Pressure Benchmark...")
@@ -56,4 +78,22 @@ def run_benchmark():
         print(f"and {'could' if result else 'could not'} be solved.")
 
     print("> Finished Transitivity Benchmark!\n")
+
+    print("< Starting Ingest Benchmark...")
+    for amount in (100_000, 1_000_000):
+        columns: list[list] = create_ingest_benchmark(amount, 100)
+        solver: Solver = Solver()
+        start_time: float = time.perf_counter()
+        solver.add_columns(*columns)
+        columns_time: float = time.perf_counter() - start_time
+
+        statements: list[tuple] = [(a, (begin, end), quality, (begin_y, end_y), b)
+                                   for a, begin, end, quality, begin_y, end_y, b in zip(*columns)]
+        solver = Solver()
+        start_time = time.perf_counter()
+        solver.add_bulk(statements)
+        bulk_time: float = time.perf_counter() - start_time
+        print(f"Model with {amount} statements: add_columns {amount / columns_time:,.0f} statements/s, "
+              f"add_bulk {amount / bulk_time:,.0f} statements/s")
+    print("> Finished Ingest Benchmark!\n")
     print("=============================== Finishes Benchmark! ===============================")
@@ -0,0 +1,150 @@
+import random
+from functools import reduce
+from typing import Union
+
+import solver.backend as backend
+import solver.rules as rules
+import statement_containers.util as util
+from solver.constants import QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB
+from solver.util import min_quality, quality_add
+from statement_containers.statement import Statement
+
+
+QUALITIES: list[str] = [QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB]
+
+
+def random_statements(rng: random.Random, amount: int) -> list[Statement]:
+    """
+    Create random statements with integer and float bounds, including statements without width
+    """
+
+    statements: list[Statement] = []
+    for _ in range(amount):
+        begin: float = rng.choice([rng.randint(0, 30), rng.uniform(0, 30)])
+        begin_y: float = rng.uniform(-10, 10)
+        statements.append(Statement(begin, begin + rng.choice([0, 1, 2, rng.uniform(0, 5)]), rng.choice(QUALITIES),
+                                    begin_y, begin_y + rng.uniform(0, 10)))
+    return statements
+
+
+def normalized(statements: list[Statement]) -> list[Statement]:
+    """
+    Normalize statements like the statement containers do, without strengthening them
+    """
+
+    overlap_map: dict = {}
+    boundaries: list[float] = util.init_boundaries(statements, overlap_map)
+    return [rules.interval_strength_multiple(point, next_point, overlap_map[point])
+            for point, next_point in zip(boundaries, boundaries[1:]) if overlap_map[point]]
+
+
+def reference_strengthen(statements: list[Statement]):
+    """
+    Minimize the height of normalized statements by applying the (L) and (R) rules of rules.py one by one,
+    the reference of the kernel used by both backends
+
+    Parameters:
+        statements (list[Statement]): normalized statements, changed in place
+    """
+
+    i: int = 0
+    while i < len(statements):
+        changed: bool = False
+        if i < len(statements) - 1:
+            result = rules.interval_strength_left(statements[i], statements[i + 1])
+            if result is not None:
+                statements[i + 1] = result
+                changed = True
+        if i > 0:
+            result = rules.interval_strength_right(statements[i - 1], statements[i])
+            if result is not None:
+                statements[i - 1] = result
+                changed = True
+        if changed:
+            i -= 1
+            continue
+        i += 1
+
+
+def reference_strength(begin: float, end: float, statements: list[Statement]) -> Statement:
+    """
+    Apply the (I+)-rule pairwise on statements, the reference of the kernel used by rules.py
+    """
+
+    return Statement(begin, end, reduce(min_quality, (st.quality for st in statements)),
+                     max(st.begin_y for st in statements), min(st.end_y for st in statements))
+
+
+def reference_join(statements: list[Statement]) -> Union[Statement, None]:
+    """
+    Apply the join rule pairwise on statements, the reference of the kernel used by rules.py
+    """
+
+    if not statements or any(a.distance_to(b) > 0 for a, b in zip(statements, statements[1:])):
+        return None
+    return Statement(statements[0].begin, statements[-1].end, reduce(quality_add, (st.quality for st in statements)),
+                     min(st.begin_y for st in statements), max(st.end_y for st in statements))
+
+
+def run_differential(models: int = 2000, seed: int = 0) -> int:
+    """
+    Compare the pure Python and the selected backend with the reference implementation on randomized 
+    models. The reference applies the rules of rules.py one statement (pair) at a time, while both 
+    backends work on whole lists (see kernels.py and compiled_kernels.pyx)
+
+    Parameters:
+        models (int): amount of random models
+        seed (int): seed of the random models
+
+    Returns:
+        (int): amount of mismatches
+    """
+
+    print(f"Comparing backend '{backend.BACKEND}' with the reference implementation...")
+    rng: random.Random = random.Random(seed)
+    mismatches: int = 0
+    for i in range(models):
+        statements: list[Statement] = random_statements(rng, rng.randint(0, 40))
+
+        expected_map: dict = {}
+        actual_map: dict = {}
+        if util.init_boundaries(statements, expected_map) != backend.init_boundaries(statements, actual_map) \
+                or expected_map != actual_map:
+            mismatches += 1
+            print(f"init_boundaries differs for model {i}")
+
+        expected: list[Statement] = normalized(statements)
+        reference_strengthen(expected)
+        for name, strengthen in (("python", util.strengthen_interval_height_sides),
+                                 (backend.BACKEND, backend.strengthen_interval_height_sides)):
+            actual: list[Statement] = normalized(statements)
+            strengthen(actual)
+            if expected != actual:
+                mismatches += 1
+                print(f"strengthen_interval_height_sides ({name}) differs for model {i}")
+
+        if statements:
+            strengthened: list[Statement] = statements[:rng.randint(1, 5)]
+            if rules.interval_strength_multiple(0, 1, set(strengthened)) != reference_strength(0, 1, strengthened):
+                mismatches += 1
+                print(f"interval_strength_multiple differs for model {i}")
+
+        joined: list[Statement] = sorted(statements, key=lambda st: st.begin)[:rng.randint(0, 5)]
+        expected_join: Union[Statement, None] = reference_join(joined)
+        for name, join in (("python", rules.interval_join_multiple), (backend.BACKEND, backend.interval_join_multiple)):
+            if join(joined) != expected_join:
+                mismatches += 1
+                print(f"interval_join_multiple ({name}) differs for model {i}")
+
+        for statement_a, statement_b in zip(statements, statements[1:]):
+            if rules.transitivity(statement_a, statement_b) != backend.transitivity(statement_a, statement_b):
+                mismatches += 1
+                print(f"transitivity differs for model {i}")
+                break
+
+    print(f"Finished with {mismatches} mismatches in {models} models")
+    return mismatches
+
+
+if __name__ == "__main__":
+    exit(1 if run_differential() else 0)
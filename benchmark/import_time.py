@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+
+IMPORT_TIME_BUDGET: float = 0.25
+HEAVY_MODULES: list[str] = ["matplotlib", "Cython", "numpy"]
+
+
+def check_import_time(runs: int = 5) -> bool:
+    """
+    Import the solver in fresh interpreters and check the import time (best of all runs) against the
+    budget. Further checks that no heavy module (e.g. matplotlib) is imported with the solver
+
+    Parameters:
+        runs (int): amount of fresh interpreters
+
+    Returns:
+        (bool): import time within budget and no heavy module imported
+    """
+
+    code: str = ("import sys, time\n"
+                 "start = time.perf_counter()\n"
+                 "import solver.solver\n"
+                 "print(time.perf_counter() - start)\n"
+                 f"print(','.join(m for m in {HEAVY_MODULES} if m in sys.modules))")
+    root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    best: float = float("inf")
+    heavy: str = ""
+    for _ in range(runs):
+        output: list[str] = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True,
+                                           check=True).stdout.split("\n")
+        best = min(best, float(output[0]))
+        heavy = heavy or output[1]
+
+    print(f"Importing the solver took {best:.3f}s (budget {IMPORT_TIME_BUDGET}s)")
+    if heavy:
+        print(f"Importing the solver imported: {heavy}")
+    return best <= IMPORT_TIME_BUDGET and not heavy
+
+
+if __name__ == "__main__":
+    exit(0 if check_import_time() else 1)
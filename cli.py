@@ -0,0 +1,174 @@
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+from typing import Union
+
+from benchmark.csv_to_model import build_model_from_csv
+from solver.constants import VALIDATION_STRICT, VALIDATION_SKIP, VALIDATION_REPAIR
+from solver.solver import Solver
+
+
+"""
+Command line interface to solve hypotheses in batches. A model is loaded from a csv file (see
+benchmark/csv_to_model.py), a JSON lines file or a binary file (see Solver.save). Hypotheses are read
+from a JSON lines file or stdin, one per line, either as list
+    ["a", [0, 1], "mono", [0, 1], "b"]
+or as object with an optional id
+    {"id": 1, "hypothesis": ["a", [0, 1], "mono", [0, 1], "b"]}
+Statements in JSON lines files use the list pattern. For each hypothesis, a JSON line with the result and
+the solving time (in seconds) is written to stdout (or a file), in the order of the hypotheses
+"""
+
+
+# solver of a worker process, used when solving in parallel
+_worker_solver: Union[Solver, None] = None
+
+
+def main(argv: list[str] = None):
+    """
+    Run the command line interface
+
+    Parameters:
+        argv (list[str]): command line arguments, the ones of the process if not given
+    """
+
+    args: argparse.Namespace = _parse_arguments(argv)
+
+    start_time: float = time.perf_counter()
+    solver: Solver = load_model(args.model, args.policy, args.statements, args.overlap, args.snap)
+    print(f"Loaded model {args.model} in {time.perf_counter() - start_time:.3f}s", file=sys.stderr)
+    if args.save:
+        solver.save(args.save)
+
+    hypotheses = open(args.hypotheses, encoding="utf-8") if args.hypotheses != "-" else sys.stdin
+    output = open(args.output, "w", encoding="utf-8") if args.output != "-" else sys.stdout
+    try:
+        lines = (line for line in hypotheses if line.strip())
+        if args.jobs > 1:
+            with Pool(args.jobs, initializer=_init_worker, initargs=(args.model, args.policy, args.statements,
+                                                                       args.overlap, args.snap)) as pool:
+                for result in pool.imap(_solve_in_worker, lines, chunksize=args.chunk_size):
+                    output.write(result + "\n")
+        else:
+            for line in lines:
+                output.write(solve_line(solver, line) + "\n")
+                output.flush()
+    finally:
+        if hypotheses is not sys.stdin:
+            hypotheses.close()
+        if output is not sys.stdout:
+            output.close()
+
+
+def load_model(path: str, policy: str = VALIDATION_STRICT, amount_of_statements: int = None,
+               overlap: float = 0, snap: float = None) -> Solver:
+    """
+    Load a model, the format is chosen by the file extension: .csv (data points, see build_model_from_csv),
+    .jsonl (statements) or any other (binary file written by Solver.save)
+
+    Parameters:
+        path (str): path of the model file
+        policy (str): handling of malformed statements
+        amount_of_statements (int): amount of statements per variable pair, for csv files
+        overlap (float): relative overlap of adjacent statements, for csv files
+        snap (float): grid to snap the bounds of the statements to (see Solver)
+
+    Returns:
+        (Solver): solver containing the model
+    """
+
+    if path.endswith(".csv"):
+        # build_model_from_csv appends the extension and keeps absolute paths
+        statements: list[tuple] = build_model_from_csv(os.path.abspath(path)[:-len(".csv")],
+                                                       default_amount_of_statements=amount_of_statements,
+                                                       default_overlap=overlap)
+    elif path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as file:
+            statements: list[tuple] = [to_statement(json.loads(line)) for line in file if line.strip()]
+    else:
+        return Solver.load(path, snap=snap)
+
+    solver: Solver = Solver(snap=snap)
+    solver.add_bulk(statements, policy)
+    return solver
+
+
+def to_statement(entry: list) -> tuple:
+    """
+    Convert a JSON list to a statement (or hypothesis)
+
+    Parameters:
+        entry (list): list of the pattern [str, [float, float], str, [float, float], str]
+
+    Returns:
+        (tuple): statement of the pattern tuple[str, tuple[float, float], str, tuple[float, float], str]
+    """
+
+    if len(entry) != 5:
+        raise ValueError(f"Expected 5 entries, got {entry}")
+    return entry[0], tuple(entry[1]), entry[2], tuple(entry[3]), entry[4]
+
+
+def solve_line(solver: Solver, line: str) -> str:
+    """
+    Solve a hypothesis given as JSON line
+
+    Parameters:
+        solver (Solver): solver containing the model
+        line (str): JSON line of the hypothesis
+
+    Returns:
+        (str): JSON line of the result, containing the error message if the line could not be solved
+    """
+
+    result: dict = {}
+    start_time: float = time.perf_counter()
+    try:
+        entry = json.loads(line)
+        if isinstance(entry, dict):
+            if "id" in entry:
+                result["id"] = entry["id"]
+            entry = entry["hypothesis"]
+        result["hypothesis"] = entry
+        result["result"] = solver.solve(to_statement(entry))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["time"] = time.perf_counter() - start_time
+    return json.dumps(result)
+
+
+def _init_worker(path: str, policy: str, amount_of_statements: int, overlap: float, snap: float):
+    global _worker_solver
+    _worker_solver = load_model(path, policy, amount_of_statements, overlap, snap)
+
+
+def _solve_in_worker(line: str) -> str:
+    return solve_line(_worker_solver, line)
+
+
+def _parse_arguments(argv: list[str] = None) -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Solve hypotheses with a model, writing the results as JSON lines")
+    parser.add_argument("model", help="model file: .csv (data points), .jsonl (statements) or binary (Solver.save)")
+    parser.add_argument("hypotheses", nargs="?", default="-",
+                        help="JSON lines file of hypotheses, stdin if not given or '-'")
+    parser.add_argument("-o", "--output", default="-", help="file to write the results to, stdout if not given")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="amount of processes solving in parallel")
+    parser.add_argument("--chunk-size", type=int, default=16, help="hypotheses sent to a process at once")
+    parser.add_argument("--policy", default=VALIDATION_STRICT,
+                        choices=[VALIDATION_STRICT, VALIDATION_SKIP, VALIDATION_REPAIR],
+                        help="handling of malformed statements in the model")
+    parser.add_argument("--statements", type=int, default=None,
+                        help="amount of statements per variable pair, for csv models")
+    parser.add_argument("--overlap", type=float, default=0, help="overlap of adjacent statements, for csv models")
+    parser.add_argument("--snap", type=float, default=None,
+                        help="grid to snap the bounds of the statements to, removing tiny segments")
+    parser.add_argument("--save", default=None, help="write the loaded model to a binary file, to load it faster")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import sys
+
+import cli
 from examples.current_voltage import get_current_voltage_example
 from solver.solver import Solver
 from benchmark.benchmark import run_benchmark
@@ -14,4 +17,8 @@ def main():
     
 
 if __name__ == '__main__':
-    main()
+    # solve hypotheses from files if arguments are given, see cli.py
+    if len(sys.argv) > 1:
+        cli.main()
+    else:
+        main()
@@ -7,16 +7,16 @@ from matplotlib.offsetbox import OffsetImage, AnnotationBbox
 
 from solver.util import fetch_image_name
 from statement_containers.statement import Statement
-from statement_containers.statement_list_dynamic import StatementListDynamic
 
 
-def plot_statements(intervals: dict, influences: list[tuple[str, str]]):
+def plot_statements(intervals: dict, influences: list[tuple[str, str]], hypothesis: tuple = None):
     """
     Plots model using matplotlib. This only builds the plots, they are shown using the show_plot method
 
     Parameters:
         intervals (dict): contains statements accesseble via its pair of variables
         influences (list): list of variable pairs, whose statements should be plotted
+        hypothesis (tuple): hypothesis that should be highlighted, none if there is none
     """
 
     # setup amount of plots
@@ -30,7 +30,6 @@ def plot_statements(intervals: dict, influences: list[tuple[str, str]]):
                         wspace=0.4,
                         hspace=1)
 
-    hypothesis = StatementListDynamic.get_instance().hypothesis
     for index, influence in enumerate(influences):
         if influence not in intervals:
             continue
@@ -50,7 +49,7 @@ def _plot_axis(axis, index: int, hypothesis: tuple, intervals: dict, influence:
     """
 
     if type(intervals[influence]) == set:
-        statements: list[Statement] = sorted(intervals[influence])
+        statements: list[Statement] = sorted(intervals[influence], key=Statement.sort_key)
     else:
         statements: list[Statement] = intervals[influence].get_statements()
 
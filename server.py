@@ -0,0 +1,258 @@
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cli import load_model, to_statement
+from solver.constants import VALIDATION_STRICT, VALIDATION_SKIP, VALIDATION_REPAIR
+from solver.solver import Solver
+
+
+"""
+Local query service keeping a model loaded. Hypotheses are posted as JSON to /solve (in the pattern of
+the command line interface, see cli.py) and answered with {"result": bool}. Counters of the service are
+returned by /stats.
+
+Requests are accepted concurrently, but solved by a single worker thread owning the solver, so the
+models of the solver stay warm. Identical hypotheses in flight are solved once, and the worker takes all
+waiting hypotheses at once and solves them with Solver.solve_many. Hypotheses of the same variable pair
+and window share one solving process, other windows of the pair share its dependency graph and cache
+"""
+
+
+class SolverService:
+    """
+    Solves hypotheses posted by concurrent requests on a single worker thread
+
+    Attributes
+    ----------
+    _solver : Solver
+        solver containing the model, only used by the worker thread
+    _queue : queue.Queue
+        hypotheses waiting to be solved
+    _in_flight : dict[tuple, Future]
+        results of the hypotheses waiting or being solved, shared by identical requests
+    _lock : threading.Lock
+        synchronizes the hypotheses in flight and the counters
+    _max_batch : int
+        maximal amount of hypotheses solved at once
+    _counters : dict[str, float]
+        amount of requests, coalesced requests, batches, solved hypotheses and errors
+    _latencies : list[float]
+        latencies of the last requests (in seconds)
+    _started : float
+        start time of the service
+    """
+
+    LATENCY_WINDOW: int = 1000
+
+    def __init__(self, solver: Solver, max_batch: int = 64):
+        """
+        Start the worker thread
+
+        Parameters:
+            solver (Solver): solver containing the model
+            max_batch (int): maximal amount of hypotheses solved at once
+        """
+
+        self._solver: Solver = solver
+        self._queue: queue.Queue = queue.Queue()
+        self._in_flight: dict[tuple, Future] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._max_batch: int = max_batch
+        self._counters: dict[str, float] = {"requests": 0, "coalesced": 0, "batches": 0, "solved": 0, "errors": 0}
+        self._latencies: list[float] = []
+        self._started: float = time.time()
+
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def solve(self, hypothesis: tuple, timeout: float = None) -> bool:
+        """
+        Solve a hypothesis, waiting for the worker thread. Identical hypotheses in flight are solved once
+
+        Parameters:
+            hypothesis (tuple): hypothesis to check
+            timeout (float): maximal time to wait (in seconds)
+
+        Returns:
+            (bool): hypothesis being derivable by the model
+        """
+
+        start_time: float = time.perf_counter()
+        with self._lock:
+            self._counters["requests"] += 1
+            future: Future = self._in_flight.get(hypothesis)
+            if future is None:
+                future = self._in_flight[hypothesis] = Future()
+                self._queue.put(hypothesis)
+            else:
+                self._counters["coalesced"] += 1
+
+        try:
+            return future.result(timeout)
+        finally:
+            with self._lock:
+                self._latencies.append(time.perf_counter() - start_time)
+                if len(self._latencies) > 2 * self.LATENCY_WINDOW:
+                    del self._latencies[:-self.LATENCY_WINDOW]
+
+    def stats(self) -> dict:
+        """
+        Get the counters of the service
+
+        Returns:
+            (dict): counters, throughput (solved hypotheses per second) and latencies (in seconds)
+        """
+
+        with self._lock:
+            stats: dict = dict(self._counters)
+            latencies: list[float] = sorted(self._latencies[-self.LATENCY_WINDOW:])
+            stats["in_flight"] = len(self._in_flight)
+        uptime: float = time.time() - self._started
+        stats["uptime"] = uptime
+        stats["throughput"] = stats["solved"] / uptime if uptime > 0 else 0
+        if latencies:
+            stats["latency_mean"] = sum(latencies) / len(latencies)
+            stats["latency_p50"] = latencies[len(latencies) // 2]
+            stats["latency_p99"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        return stats
+
+    def _work(self):
+        """
+        Take the waiting hypotheses and solve them in batches
+        """
+
+        while True:
+            batch: list[tuple] = [self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                results: list = self._solver.solve_many(batch)
+            except Exception:
+                # solve one by one, to assign the error to its hypothesis
+                results = []
+                for hypothesis in batch:
+                    try:
+                        results.append(self._solver.solve(hypothesis))
+                    except Exception as e:
+                        results.append(e)
+
+            with self._lock:
+                self._counters["batches"] += 1
+                for hypothesis, result in zip(batch, results):
+                    future: Future = self._in_flight.pop(hypothesis)
+                    if isinstance(result, Exception):
+                        self._counters["errors"] += 1
+                        future.set_exception(result)
+                    else:
+                        self._counters["solved"] += 1
+                        future.set_result(result)
+
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles requests to the service: POST /solve and GET /stats
+    """
+
+    service: SolverService = None
+    timeout_per_request: float = None
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        try:
+            entry = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if isinstance(entry, dict):
+                entry = entry["hypothesis"]
+            hypothesis: tuple = to_statement(entry)
+        except (ValueError, KeyError, TypeError) as e:
+            self._respond(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        start_time: float = time.perf_counter()
+        try:
+            result: bool = self.service.solve(hypothesis, self.timeout_per_request)
+        except Exception as e:
+            self._respond(422, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._respond(200, {"result": result, "time": time.perf_counter() - start_time})
+
+    def do_GET(self):
+        if self.path != "/stats":
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+            return
+        self._respond(200, self.service.stats())
+
+    def _respond(self, status: int, content: dict):
+        body: bytes = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(solver: Solver, host: str = "127.0.0.1", port: int = 8642, max_batch: int = 64,
+          timeout: float = None) -> ThreadingHTTPServer:
+    """
+    Create the HTTP server of the service. Requests are handled after calling 'serve_forever'
+
+    Parameters:
+        solver (Solver): solver containing the model
+        host (str): host to listen on, only local by default
+        port (int): port to listen on
+        max_batch (int): maximal amount of hypotheses solved at once
+        timeout (float): maximal time to wait for a result (in seconds)
+
+    Returns:
+        (ThreadingHTTPServer): server of the service
+    """
+
+    handler: type = type("Handler", (SolverRequestHandler,), {"service": SolverService(solver, max_batch),
+                                                              "timeout_per_request": timeout})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: list[str] = None):
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Serve hypothesis queries over HTTP")
+    parser.add_argument("model", help="model file: .csv (data points), .jsonl (statements) or binary (Solver.save)")
+    parser.add_argument("--host", default="127.0.0.1", help="host to listen on")
+    parser.add_argument("--port", type=int, default=8642, help="port to listen on")
+    parser.add_argument("--max-batch", type=int, default=64, help="maximal amount of hypotheses solved at once")
+    parser.add_argument("--timeout", type=float, default=None, help="maximal time to wait for a result")
+    parser.add_argument("--policy", default=VALIDATION_STRICT,
+                        choices=[VALIDATION_STRICT, VALIDATION_SKIP, VALIDATION_REPAIR],
+                        help="handling of malformed statements in the model")
+    parser.add_argument("--statements", type=int, default=None,
+                        help="amount of statements per variable pair, for csv models")
+    parser.add_argument("--overlap", type=float, default=0, help="overlap of adjacent statements, for csv models")
+    parser.add_argument("--snap", type=float, default=None,
+                        help="grid to snap the bounds of the statements to, removing tiny segments")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    server: ThreadingHTTPServer = serve(load_model(args.model, args.policy, args.statements, args.overlap, args.snap),
+                                        args.host, args.port, args.max_batch, args.timeout)
+    print(f"Serving {args.model} on http://{args.host}:{server.server_address[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
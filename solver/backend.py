@@ -0,0 +1,67 @@
+import importlib.util
+import os
+import tempfile
+
+import solver.rules as rules
+import statement_containers.util as util
+
+
+"""
+Selects the implementation of the hot functions of the rule set at import time. The compiled backend
+(compiled_kernels.pyx) is used if it is built and not older than its source, otherwise the pure
+Python implementations of rules.py and statement_containers/util.py are used. Those remain the reference, both backends give the
+same results (see benchmark/differential.py). Setting the environment variable SOLVER_BACKEND to 'python'
+forces the pure Python backend. Importing never builds the module: it is built next to its source by
+running 'python -m solver.backend', which needs Cython and a C compiler. A module which fails to load
+(e.g. built for another platform) falls back to the pure Python backend as well
+"""
+
+
+BACKEND_PYTHON: str = "python"
+BACKEND_COMPILED: str = "compiled"
+SOURCE: str = os.path.join(os.path.dirname(__file__), "compiled_kernels.pyx")
+
+init_boundaries = util.init_boundaries
+strengthen_interval_height_sides = util.strengthen_interval_height_sides
+interval_join_multiple = rules.interval_join_multiple
+transitivity = rules.transitivity
+BACKEND: str = BACKEND_PYTHON
+
+
+def build():
+    """
+    Build the compiled backend next to its source, so later imports use it. Raises the errors of Cython 
+    or the C compiler if the build fails
+    """
+
+    import pyximport
+
+    # the build options are set by installing the import hook, which is removed afterwards
+    importers: tuple = pyximport.install(language_level=3)
+    try:
+        with tempfile.TemporaryDirectory() as build_dir:
+            pyximport.build_module("solver.compiled_kernels", SOURCE, pyxbuild_dir=build_dir, inplace=True,
+                                   language_level=3)
+    finally:
+        pyximport.uninstall(*importers)
+
+
+if os.environ.get("SOLVER_BACKEND", BACKEND_COMPILED) != BACKEND_PYTHON:
+    try:
+        built = importlib.util.find_spec("solver.compiled_kernels")
+        if built is None or os.path.getmtime(built.origin) < os.path.getmtime(SOURCE):
+            raise ImportError("compiled backend is not built or older than its source")
+        import solver.compiled_kernels as compiled_kernels
+    except Exception:
+        pass
+    else:
+        init_boundaries = compiled_kernels.init_boundaries
+        strengthen_interval_height_sides = compiled_kernels.strengthen_interval_height_sides
+        interval_join_multiple = compiled_kernels.interval_join_multiple
+        transitivity = compiled_kernels.transitivity
+        BACKEND = BACKEND_COMPILED
+
+
+if __name__ == "__main__":
+    build()
+    print(f"Built the compiled backend from {SOURCE}")
@@ -0,0 +1,130 @@
+import time
+from collections import namedtuple
+from typing import Union
+
+from solver.constants import RESULT_PROVEN, RESULT_NOT_PROVEN, RESULT_UNKNOWN
+
+
+class BudgetExhausted(Exception):
+    """
+    Raised inside a solving process when its budget is exhausted, to stop composing transitive statements
+    """
+
+
+class SolveResult(namedtuple('SolveResultBase', ['status', 'derived', 'rule_applications', 'time'])):
+    """
+    Result of a solving process with a budget
+
+    namedtuple
+    ----------
+    status (str):
+        proven, not proven or unknown (budget exhausted before the hypothesis could be proven)
+    derived (int):
+        amount of transitive statements derived
+    rule_applications (int):
+        amount of applications of the transitivity rule
+    time (float):
+        solving time (in seconds)
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return self.status == RESULT_PROVEN
+
+
+class Budget:
+    """
+    Limits the work of a solving process. The counters are charged while transitive statements are 
+    composed, which is stopped by raising BudgetExhausted once a limit is exceeded
+
+    Attributes
+    ----------
+    deadline : float
+        point in time (of time.perf_counter) to stop at, none for no limit
+    max_derived : int
+        maximal amount of derived statements, none for no limit
+    max_rule_applications : int
+        maximal amount of applications of the transitivity rule, none for no limit
+    derived : int
+        amount of derived statements
+    rule_applications : int
+        amount of applications of the transitivity rule
+    exhausted : bool
+        a limit was exceeded
+    _start : float
+        start time of the solving process
+    """
+
+    def __init__(self, deadline: float = None, max_derived: int = None, max_rule_applications: int = None):
+        """
+        Initialize the budget, starting the clock
+
+        Parameters:
+            deadline (float): maximal solving time (in seconds)
+            max_derived (int): maximal amount of derived statements
+            max_rule_applications (int): maximal amount of applications of the transitivity rule
+        """
+
+        self._start: float = time.perf_counter()
+        self.deadline: Union[float, None] = None if deadline is None else self._start + deadline
+        self.max_derived: Union[int, None] = max_derived
+        self.max_rule_applications: Union[int, None] = max_rule_applications
+        self.derived: int = 0
+        self.rule_applications: int = 0
+        self.exhausted: bool = False
+
+    def charge(self, rule_applications: int = 0, derived: int = 0):
+        """
+        Count work and check the limits. Rule applications are charged before they are done and not 
+        counted if they exceed the limit, derived statements are charged after they were derived, 
+        stopping once the limit is reached
+
+        Parameters:
+            rule_applications (int): amount of applications of the transitivity rule
+            derived (int): amount of derived statements
+        """
+
+        if self.max_rule_applications is not None and \
+                self.rule_applications + rule_applications > self.max_rule_applications:
+            self.exhausted = True
+            raise BudgetExhausted()
+        self.rule_applications += rule_applications
+        self.derived += derived
+        if (self.max_derived is not None and self.derived >= self.max_derived) or \
+                (self.deadline is not None and time.perf_counter() > self.deadline):
+            self.exhausted = True
+            raise BudgetExhausted()
+
+    def charge_partial(self, rule_applications: int) -> int:
+        """
+        Charge as many of the given rule applications as the limit allows, so a batch of them can be done 
+        partially. Throws BudgetExhausted like 'charge', if none is allowed
+
+        Parameters:
+            rule_applications (int): amount of applications of the transitivity rule
+
+        Returns:
+            (int): amount of charged rule applications, the remaining ones exceed the limit
+        """
+
+        if self.max_rule_applications is not None:
+            rule_applications = min(rule_applications, self.max_rule_applications - self.rule_applications)
+            if rule_applications <= 0:
+                self.exhausted = True
+                raise BudgetExhausted()
+        self.charge(rule_applications)
+        return rule_applications
+
+    def result(self, proven: bool) -> SolveResult:
+        """
+        Create the result of the solving process
+
+        Parameters:
+            proven (bool): hypothesis was proven
+
+        Returns:
+            (SolveResult): result and the consumed budget
+        """
+
+        status: str = RESULT_PROVEN if proven else RESULT_UNKNOWN if self.exhausted else RESULT_NOT_PROVEN
+        return SolveResult(status, self.derived, self.rule_applications, time.perf_counter() - self._start)
@@ -0,0 +1,125 @@
+import heapq
+from bisect import bisect_left
+from operator import attrgetter
+
+from statement_containers.statement import Statement
+
+
+"""
+Compaction of the statements of a variable pair. Statements of the same quality and domain,
+which overlap or touch, are joined (the join rule keeps their quality and domain), and statements
+dominated by another one (see Statement.stronger_as) are removed, since they can be derived from it.
+The rules are only monotone on consistent statements: on contradicting ones (overlapping ranges with
+disjoint domains) the strength rule produces empty domains, and a dominated statement can still change
+what is derived from them. Pairs with contradicting statements are therefore left unchanged
+"""
+
+
+def compact_statements(statements: set[Statement]) -> set[Statement]:
+    """
+    Compact the statements of a variable pair
+
+    Parameters:
+        statements (set[Statement]): statements of the pair
+
+    Returns:
+        (set[Statement]): compacted statements, the given ones if they contradict each other
+    """
+
+    if contradicting(statements):
+        return statements
+    return remove_dominated(join_touching(statements))
+
+
+def contradicting(statements: set[Statement]) -> bool:
+    """
+    Check if statements contradict each other, i.e. two of them overlap on the range interval but not 
+    on the domain interval. The ranges of such statements overlap at the later begin of both, so the 
+    domains of the statements overlapping each begin are compared: they are disjoint if the highest 
+    begin is above the lowest end
+
+    Parameters:
+        statements (set[Statement]): statements of a variable pair
+
+    Returns:
+        (bool): statements contradicting each other
+    """
+
+    highest_begins: list[tuple[float, float]] = []  # (-begin_y, end) of the statements overlapping
+    lowest_ends: list[tuple[float, float]] = []  # (end_y, end) of the statements overlapping
+    for st in sorted(statements, key=attrgetter('begin')):
+        heapq.heappush(highest_begins, (-st.begin_y, st.end))
+        heapq.heappush(lowest_ends, (st.end_y, st.end))
+
+        # statements ending before this begin do not overlap it, or any later begin
+        while highest_begins[0][1] < st.begin:
+            heapq.heappop(highest_begins)
+        while lowest_ends[0][1] < st.begin:
+            heapq.heappop(lowest_ends)
+        if -highest_begins[0][0] > lowest_ends[0][0]:
+            return True
+    return False
+
+
+def join_touching(statements: set[Statement]) -> set[Statement]:
+    """
+    Join statements with the same quality and domain, which overlap or touch
+
+    Parameters:
+        statements (set[Statement]): statements to join
+
+    Returns:
+        (set[Statement]): joined statements
+    """
+
+    grouped: dict[tuple, list[Statement]] = {}
+    for st in statements:
+        grouped.setdefault((st.quality, st.begin_y, st.end_y), []).append(st)
+
+    joined: set[Statement] = set()
+    for group in grouped.values():
+        if len(group) == 1:
+            joined.add(group[0])
+            continue
+
+        group.sort(key=attrgetter('begin'))
+        current: Statement = group[0]
+        for st in group[1:]:
+            if st.begin > current.end:
+                joined.add(current)
+                current = st
+            elif st.end > current.end:
+                current = Statement(current.begin, st.end, current.quality, current.begin_y, current.end_y)
+        joined.add(current)
+    return joined
+
+
+def remove_dominated(statements: set[Statement]) -> set[Statement]:
+    """
+    Remove statements, if another statement is stronger
+
+    Parameters:
+        statements (set[Statement]): statements to check
+
+    Returns:
+        (set[Statement]): statements not dominated by another one
+    """
+
+    by_begin: list[Statement] = sorted(statements, key=attrgetter('begin'))
+    begins: list[float] = [st.begin for st in by_begin]
+    max_width: float = max((st.end - st.begin for st in by_begin), default=0)
+
+    kept: set[Statement] = set()
+    for i, st in enumerate(by_begin):
+        # a stronger statement envelops this one, so it begins in [end - max_width, begin]
+        dominated: bool = False
+        for j in range(bisect_left(begins, st.end - max_width), len(by_begin)):
+            other: Statement = by_begin[j]
+            if other.begin > st.begin:
+                break
+            if j != i and other.stronger_as(st):
+                dominated = True
+                break
+        if not dominated:
+            kept.add(st)
+    return kept
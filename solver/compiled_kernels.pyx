@@ -0,0 +1,171 @@
+# cython: language_level=3
+from libc.stdlib cimport malloc, free
+
+from statement_containers.statement import Statement
+from solver.constants import QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB, ADD, TIMES
+
+
+"""
+Compiled versions of the hot functions of the rule set, selected by backend.py if Cython is available.
+The pure Python implementations in rules.py and statement_containers/util.py are the reference,
+the functions here have the same signatures and results
+"""
+
+
+cdef dict CODES = {QUALITY_MONO: 0, QUALITY_ANTI: 1, QUALITY_CONS: 2, QUALITY_ARB: 3}
+
+
+def init_boundaries(statements, dict overlap_map):
+    """
+    Collect all boundaries of a model, sort them, and save statements overlapping each bound.
+    See util.init_boundaries
+    """
+
+    cdef set tmp_boundaries = set()
+    cdef set to_add = set()
+    cdef set ended
+    cdef set current
+    for st in statements:
+        begin, end = st[0], st[1]
+        if begin not in overlap_map:
+            overlap_map[begin] = set()
+            tmp_boundaries.add(begin)
+        if end not in overlap_map:
+            overlap_map[end] = set()
+            tmp_boundaries.add(end)
+        (<set> overlap_map[begin]).add(st)
+        (<set> overlap_map[end]).add(st)
+
+    boundaries = sorted(tmp_boundaries)
+    for var in boundaries:
+        current = overlap_map[var]
+        ended = to_add & current
+        current -= ended
+        to_add -= ended
+        current |= to_add
+        to_add |= current
+
+    return boundaries
+
+
+def strengthen_interval_height_sides(list statements):
+    """
+    Minimize height of statements using the (R) and (L) rules. See util.strengthen_interval_height_sides
+    """
+
+    cdef Py_ssize_t length = len(statements)
+    if length == 0:
+        return
+
+    cdef double *begin = <double *> malloc(4 * length * sizeof(double))
+    cdef int *quality = <int *> malloc(length * sizeof(int))
+    if begin == NULL or quality == NULL:
+        free(begin)
+        free(quality)
+        raise MemoryError()
+    cdef double *end = begin + length
+    cdef double *begin_y = end + length
+    cdef double *end_y = begin_y + length
+    cdef double x, y, a, b, new_begin_y, new_end_y
+    cdef int q
+    cdef bint changed
+    cdef Py_ssize_t i = 0, j, k
+    cdef tuple st
+
+    try:
+        for i in range(length):
+            st = <tuple> statements[i]
+            begin[i] = st[0]
+            end[i] = st[1]
+            quality[i] = CODES[st[2]]
+            begin_y[i] = st[3]
+            end_y[i] = st[4]
+
+        i = 0
+        while i < length:
+            changed = False
+
+            # (L)-rule on statements i and i + 1, changes statement i + 1
+            if i < length - 1:
+                # index -1 wraps around, like in the Python implementation
+                k = i + length if i < 0 else i
+                j = i + 1
+                if begin[k] <= begin[j] <= end[k]:
+                    x, y, a, b, q = begin_y[k], end_y[k], begin_y[j], end_y[j], quality[j]
+                    new_begin_y, new_end_y = a, b
+                    if q == 2 and x < b:
+                        new_begin_y, new_end_y = max(x, a), min(y, b)
+                    elif q == 0 and a < x < b:
+                        new_begin_y = x
+                    elif q == 1 and a < y < b:
+                        new_end_y = y
+                    if not (a >= new_begin_y and b <= new_end_y):
+                        begin_y[j], end_y[j] = new_begin_y, new_end_y
+                        changed = True
+
+            # (R)-rule on statements i - 1 and i, changes statement i - 1
+            if i > 0:
+                j = i - 1
+                if begin[i] <= end[j] <= end[i]:
+                    x, y, a, b, q = begin_y[j], end_y[j], begin_y[i], end_y[i], quality[j]
+                    new_begin_y, new_end_y = x, y
+                    if x < b:
+                        if q == 2:
+                            new_begin_y, new_end_y = max(x, a), min(y, b)
+                        elif q == 0 and b < y:
+                            new_end_y = b
+                    elif q == 1 and x < a < y:
+                        new_begin_y = a
+                    if not (x >= new_begin_y and y <= new_end_y):
+                        begin_y[j], end_y[j] = new_begin_y, new_end_y
+                        changed = True
+
+            if changed:
+                i -= 1
+                continue
+            i += 1
+
+        for i in range(length):
+            st = <tuple> statements[i]
+            if <double> st[3] != begin_y[i] or <double> st[4] != end_y[i]:
+                statements[i] = tuple.__new__(Statement, (st[0], st[1], st[2], begin_y[i], end_y[i]))
+    finally:
+        free(begin)
+        free(quality)
+
+
+def interval_join_multiple(list statements):
+    """
+    Implementation of the join rule. See rules.interval_join_multiple
+    """
+
+    if not statements:
+        return None
+
+    cdef Py_ssize_t i
+    first = statements[0]
+    quality, begin_y, end_y = first[2], first[3], first[4]
+    for i in range(len(statements)):
+        st = statements[i]
+        # the distance of statements is positive, if they do not overlap
+        if i > 0 and not (st[0] <= statements[i - 1][1] and st[1] >= statements[i - 1][0]):
+            return None
+        quality = ADD[quality][st[2]]
+        if st[3] < begin_y:
+            begin_y = st[3]
+        if st[4] > end_y:
+            end_y = st[4]
+
+    return tuple.__new__(Statement, (first[0], statements[-1][1], quality, begin_y, end_y))
+
+
+def transitivity(statement_a, statement_b):
+    """
+    Implementation of the (T)-rule. See rules.transitivity
+    """
+
+    if not (statement_a[3] >= statement_b[0] and statement_a[4] <= statement_b[1]):
+        return None
+
+    return tuple.__new__(Statement, (statement_a[0], statement_a[1], TIMES[statement_a[2]][statement_b[2]],
+                                     statement_b[3], statement_b[4]))
@@ -41,7 +41,60 @@ TIMES: dict = {
                   QUALITY_ARB: QUALITY_ARB},
 }
 
+# strongest quality implied by both qualities
+MIN: dict = {
+    QUALITY_MONO: {QUALITY_MONO: QUALITY_MONO,
+                   QUALITY_ANTI: QUALITY_CONS,
+                   QUALITY_CONS: QUALITY_CONS,
+                   QUALITY_ARB: QUALITY_MONO},
+    QUALITY_ANTI: {QUALITY_MONO: QUALITY_CONS,
+                   QUALITY_ANTI: QUALITY_ANTI,
+                   QUALITY_CONS: QUALITY_CONS,
+                   QUALITY_ARB: QUALITY_ANTI},
+    QUALITY_CONS: {QUALITY_MONO: QUALITY_CONS,
+                   QUALITY_ANTI: QUALITY_CONS,
+                   QUALITY_CONS: QUALITY_CONS,
+                   QUALITY_ARB: QUALITY_CONS},
+    QUALITY_ARB: {QUALITY_MONO: QUALITY_MONO,
+                  QUALITY_ANTI: QUALITY_ANTI,
+                  QUALITY_CONS: QUALITY_CONS,
+                  QUALITY_ARB: QUALITY_ARB},
+}
+
+# first quality implies the second one
+STRONGER: dict = {
+    QUALITY_MONO: {QUALITY_MONO: True,
+                   QUALITY_ANTI: False,
+                   QUALITY_CONS: False,
+                   QUALITY_ARB: True},
+    QUALITY_ANTI: {QUALITY_MONO: False,
+                   QUALITY_ANTI: True,
+                   QUALITY_CONS: False,
+                   QUALITY_ARB: True},
+    QUALITY_CONS: {QUALITY_MONO: True,
+                   QUALITY_ANTI: True,
+                   QUALITY_CONS: True,
+                   QUALITY_ARB: True},
+    QUALITY_ARB: {QUALITY_MONO: False,
+                  QUALITY_ANTI: False,
+                  QUALITY_CONS: False,
+                  QUALITY_ARB: True},
+}
+
+# orders the qualities consistently with STRONGER, stronger qualities have a higher rank
+QUALITY_RANK: dict = {QUALITY_ARB: 0, QUALITY_MONO: 1, QUALITY_ANTI: 1, QUALITY_CONS: 2}
+
 SEARCH_LEFT: str = "left"
 SEARCH_RIGHT: str = "right"
 CORRECT_UPPER: str = "upper"
 CORRECT_LOWER: str = "lower"
+
+VALIDATION_STRICT: str = "strict"
+VALIDATION_SKIP: str = "skip"
+VALIDATION_REPAIR: str = "repair"
+
+TRANSITIVE_CACHE_SIZE: int = 100000
+
+RESULT_PROVEN: str = "proven"
+RESULT_NOT_PROVEN: str = "not proven"
+RESULT_UNKNOWN: str = "unknown"
@@ -0,0 +1,48 @@
+class CopyOnWriteDict(dict):
+    """
+    Dictionary mapping keys to sets, whose copies share the sets until they are changed. 
+    Sets must only be changed through the set returned by 'mutable', reading works like 
+    with a normal dictionary.
+
+    Attributes
+    ----------
+    _owned : set
+        keys of the sets only used by this dictionary, those can be changed in place
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._owned: set = set(self.keys())
+
+    def copy(self) -> 'CopyOnWriteDict':
+        """
+        Copy the dictionary without copying the sets. Both dictionaries copy a set before changing it
+
+        Returns:
+            (CopyOnWriteDict): copy sharing the sets
+        """
+
+        self._owned = set()
+        shared: CopyOnWriteDict = CopyOnWriteDict(self)
+        shared._owned = set()
+        return shared
+
+    def mutable(self, key) -> set:
+        """
+        Get a set that can be changed, copy it first if it is shared. Creates an empty set if needed
+
+        Parameters:
+            key: key of the set
+
+        Returns:
+            (set): set that can be changed in place
+        """
+
+        if key not in self._owned:
+            self[key] = set(self[key]) if key in self else set()
+            self._owned.add(key)
+        return self[key]
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._owned.discard(key)
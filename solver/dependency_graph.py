@@ -1,176 +1,311 @@
+from array import array
 from collections import deque
+from typing import Iterator
+
+from solver.copy_on_write import CopyOnWriteDict
+from solver.symbol_table import SymbolTable
 
 
 class DependencyGraph:
     """
-    Graph containing variables, with edges representing the presence of statement(s) 
-    related to that pair of variables. 
-    Used to prevent adding influencing circles and to extract order to build 
+    Graph containing variables (by their id), with edges representing the presence of statement(s)
+    related to that pair of variables.
+    Used to prevent adding influencing circles and to extract order to build
     transitive cover of important (for hypothesis) variables
-    """
 
-    _start: str
-    _end: str
+    Attributes
+    ----------
+    _dependency_graph : CopyOnWriteDict
+        maps variables to the variables they influence, used to change the graph
+    _adjacency : tuple[array, array, array, array]
+        CSR-style adjacency arrays (successor offsets, successors, predecessor offsets, predecessors)
+        used for solving. Compiled on demand and dropped when the graph changes
+    _symbols : SymbolTable
+        names of the variables, used for error messages
+    """
 
-    def __init__(self):
+    def __init__(self, symbols: SymbolTable = None):
         """
         Sets up the struct of the graph
+
+        Parameters:
+            symbols (SymbolTable): names of the variables
         """
-        self._dependency_graph: dict[str, set[str]] = {}
+        self._dependency_graph: CopyOnWriteDict = CopyOnWriteDict()
+        self._adjacency: tuple = None
+        self._symbols: SymbolTable = symbols
 
-    def setup(self, start: str, end: str) -> list[str]:
+    def copy(self) -> 'DependencyGraph':
         """
-        Extract important variables (those that lie in a path from 'start' to 'end') and 
-        removes the other variables.
-        Further, extract variable order for resolving transitive statements
+        Copy the graph. The edges are shared until one of the graphs changes them
 
-        Parameters:
-            start (str): influencing variable of the hypothesis
-            end (str): influenced variable of the hypothesis
-        
         Returns:
-            order (list[str]): order of the variables    
+            (DependencyGraph): copy of the graph
         """
-        self._start = start
-        self._end = end
 
-        # find all nodes between start and end and remove the others
-        vars_on_path: set[str] = self._dsf(start, set(), set())
-        self._remove_nodes(set(self._dependency_graph.keys()) - vars_on_path)
+        graph: DependencyGraph = DependencyGraph(self._symbols)
+        graph._dependency_graph = self._dependency_graph.copy()
+        graph._adjacency = self._adjacency
+        return graph
 
-        # build an order on the variables
-        order: list[str] = self._bfs()
+    def setup(self, start: int, end: int) -> 'ReducedGraph':
+        """
+        Extract important variables (those that lie in a path from 'start' to 'end').
+        Further, extract variable order for resolving transitive statements
 
-        return order
+        Parameters:
+            start (int): influencing variable of the hypothesis
+            end (int): influenced variable of the hypothesis
+
+        Returns:
+            (ReducedGraph): graph of the important variables, containing their order
+        """
 
-    def add(self, a: str, b: str, check: bool = True):
+        return ReducedGraph(self._compile(), start, end)
+
+    def add(self, a: int, b: int, check: bool = True):
         """
         Add an edge to the graph
 
         Parameters:
-            a (str): start of the edge
-            b (str): end of the edge
-            check (bool): check if adding the edge creates a cycle 
-        """
-        if a not in self._dependency_graph:
-            self._dependency_graph[a] = set()
-        if b not in self._dependency_graph[a]:
-            self._dependency_graph[a].add(b)
+            a (int): start of the edge
+            b (int): end of the edge
+            check (bool): check if adding the edge creates a cycle
+        """
+        if b not in self._dependency_graph.get(a, ()):
+            self._dependency_graph.mutable(a).add(b)
+            self._adjacency = None
             if check:
                 self._check_for_cycle(a, b)
 
-    def _check_for_cycle(self, a: str, b: str):
+    def remove(self, a: int, b: int):
         """
-        Check if a cycle exists and throw an exception if found. Check this for each node in the graph
+        Remove an edge from the graph
 
         Parameters:
-            a (str): last added edge start point
-            b (str): last added edge end point
+            a (int): start of the edge
+            b (int): end of the edge
         """
-        for node in self._dependency_graph:
-            if self._dsf_cycle_check(node, set()):
-                raise Exception(f"Couldn't add rule ({a}, {b})-dependency, because it destroys the implicit partial "
-                                f"order.\n This can be fixed by checking the dependency graph.\n"
-                                f"{self._dependency_graph}")
 
-    def _dsf_cycle_check(self, current: str, stack: set[str]):
+        if b not in self._dependency_graph.get(a, ()):
+            return
+        self._dependency_graph.mutable(a).discard(b)
+        if not self._dependency_graph[a]:
+            del self._dependency_graph[a]
+        self._adjacency = None
+
+    def _check_for_cycle(self, a: int, b: int):
         """
-        Check for cycles using recursive dsf
+        Check if the last added edge closes a cycle, which is the case if its start is reachable 
+        from its end. Removes the edge and throws an exception if so
 
         Parameters:
-            current (str): current node
-            stack (set[str]): stack to keep track of path
+            a (int): last added edge start point
+            b (int): last added edge end point
+        """
+        stack: list[int] = [b]
+        visited: set[int] = {b}
+        while stack:
+            node: int = stack.pop()
+            if node == a:
+                self.remove(a, b)
+                raise Exception(f"Couldn't add rule ({self._name(a)}, {self._name(b)})-dependency, because it "
+                                f"destroys the implicit partial order.\n This can be fixed by checking the "
+                                f"dependency graph.\n{self}")
+            for child in self._dependency_graph.get(node, ()):
+                if child not in visited:
+                    visited.add(child)
+                    stack.append(child)
+
+    def has_cycle(self) -> bool:
+        """
+        Check if the graph contains a cycle, by repeatedly removing nodes without incoming edges 
+        (Kahn's algorithm). Used to check many added edges at once
 
         Returns:
             bool: cycle found
         """
-        if current in stack:
-            return True
-
-        stack.add(current)
-
-        if current in self._dependency_graph:
-            for node in self._dependency_graph[current]:
-                if self._dsf_cycle_check(node, stack.copy()):
-                    return True
-        return False
+        incoming: dict[int, int] = {}
+        for children in self._dependency_graph.values():
+            for child in children:
+                incoming[child] = incoming.get(child, 0) + 1
+
+        stack: list[int] = [node for node in self._dependency_graph if node not in incoming]
+        removed: int = 0
+        while stack:
+            node: int = stack.pop()
+            removed += 1
+            for child in self._dependency_graph.get(node, ()):
+                incoming[child] -= 1
+                if incoming[child] == 0:
+                    stack.append(child)
+
+        nodes: set[int] = set(self._dependency_graph) | set(incoming)
+        return removed < len(nodes)
+
+    def _compile(self) -> tuple:
+        """
+        Build the CSR-style adjacency arrays of the graph, if not done yet
 
-    def get_vars_on_path(self) -> set[str]:
-        return self._dsf(self._start, set(), set())
+        Returns:
+            (tuple[array, array, array, array]): successor offsets, successors, predecessor offsets
+            and predecessors. The neighbours of node i are at [offsets[i], offsets[i + 1])
+        """
 
-    def get_pre(self, node: str) -> set[str]:
-        return {key for key, value in self._dependency_graph.items() if node in value}
+        if self._adjacency is not None:
+            return self._adjacency
+
+        size: int = 1 + max((max(node, max(children, default=node)) for node, children in
+                              self._dependency_graph.items()), default=-1)
+        successor_offsets: array = array('i', [0] * (size + 1))
+        predecessor_offsets: array = array('i', [0] * (size + 1))
+        for node, children in self._dependency_graph.items():
+            successor_offsets[node + 1] = len(children)
+            for child in children:
+                predecessor_offsets[child + 1] += 1
+        for i in range(size):
+            successor_offsets[i + 1] += successor_offsets[i]
+            predecessor_offsets[i + 1] += predecessor_offsets[i]
+
+        successors: array = array('i', [0] * successor_offsets[-1])
+        predecessors: array = array('i', [0] * predecessor_offsets[-1])
+        filled: list[int] = list(predecessor_offsets[:-1])
+        for node, children in self._dependency_graph.items():
+            position: int = successor_offsets[node]
+            for child in children:
+                successors[position] = child
+                position += 1
+                predecessors[filled[child]] = node
+                filled[child] += 1
+
+        self._adjacency = (successor_offsets, successors, predecessor_offsets, predecessors)
+        return self._adjacency
+
+    def _name(self, node: int) -> str:
+        return self._symbols.name(node) if self._symbols is not None else str(node)
+
+    def __str__(self) -> str:
+        return str({self._name(node): {self._name(child) for child in children}
+                    for node, children in self._dependency_graph.items()})
+
+
+class ReducedGraph:
+    """
+    Part of the dependency graph, containing the variables that lie in a path from the influencing
+    to the influenced variable of a hypothesis. Variables are removed from it while building the
+    transitive cover, without changing the dependency graph
+
+    Attributes
+    ----------
+    order : list[int]
+        order of the variables to resolve transitive statements
+    _nodes : set[int]
+        variables remaining in the graph
+    """
 
-    def _bfs(self) -> list[str]:
+    def __init__(self, adjacency: tuple, start: int, end: int):
         """
-        Use recursive bsf from the end node to extract suitable order
+        Extract the important variables and their order
 
-        Returns:
-            order (list[str]): ordered (relevant) variables
+        Parameters:
+            adjacency (tuple[array, array, array, array]): CSR-style adjacency arrays of the graph
+            start (int): influencing variable of the hypothesis
+            end (int): influenced variable of the hypothesis
         """
+        self._adjacency: tuple = adjacency
+        self._start: int = start
+        self._end: int = end
 
-        assert self._start != self._end, "No need to search an order when start == end"
+        # variables on a path are reachable from start and can reach end
+        self._nodes: set[int] = self._reachable(start, 0) & self._reachable(end, 2)
+        self.order: list[int] = self._post_order()
 
-        order: list = []
-        visited: set[str] = {self._start, self._end}
-        queue: deque = deque()
-        queue.append(self._start)
+    def copy(self) -> 'ReducedGraph':
+        """
+        Copy the graph, so variables can be removed from the copy without changing this graph
 
-        while len(queue) > 0:
-            node = queue.popleft()
-            if node not in self._dependency_graph:
-                continue
-            for child in self._dependency_graph[node]:
-                if child not in visited:
-                    order.append(child)
-                    queue.append(child)
-                    visited.add(child)
+        Returns:
+            (ReducedGraph): copy of the graph
+        """
 
-        return order[::-1]
+        graph: ReducedGraph = ReducedGraph.__new__(ReducedGraph)
+        graph._adjacency, graph._start, graph._end = self._adjacency, self._start, self._end
+        graph._nodes = set(self._nodes)
+        graph.order = list(self.order)
+        return graph
 
-    def _dsf(self, current: str, stack: set[str], nodes: set) -> set:
+    def get_edges(self) -> list[tuple[int, int]]:
         """
-        Recursive dsf
+        Get the edges between the remaining variables, i.e. the variable pairs having statements
 
-        Parameters:
-            current (str): current node
-            stack (set[str]): stack to remember path
-            nodes (set[str]): container with nodes that lie between start and end node
-        
         Returns:
-            nodes (set[str]): container with nodes that lie between start and end node
+            (list[tuple[int, int]]): edges of the graph
         """
-        if current in stack:
-            return nodes
-
-        stack.add(current)
+        return [(node, child) for node in self._nodes for child in self._neighbours(node, 0) if child in self._nodes]
 
-        if current == self._end:
-            nodes.update(stack)
-            return nodes
-        if current in self._dependency_graph:
-            for node in self._dependency_graph[current]:
-                self._dsf(node, stack.copy(), nodes)
-        return nodes
+    def get_pre(self, node: int) -> list[int]:
+        return [pre for pre in self._neighbours(node, 2) if pre in self._nodes]
 
-    def _remove_nodes(self, to_remove: set[str]):
+    def remove_node(self, node: int):
         """
-        Removes nodes fro the graph
+        Removes node from the graph
 
         Parameters:
-            to_remove (set[str]): Container of nodes to remove
+            node (int): node to remove
         """
-        for node in to_remove:
-            self.remove_node(node)
+        self._nodes.discard(node)
 
-    def remove_node(self, node: str):
+    def _neighbours(self, node: int, direction: int):
         """
-        Removes node from the graph
+        Get the successors (direction 0) or predecessors (direction 2) of a node
+        """
+        offsets, targets = self._adjacency[direction], self._adjacency[direction + 1]
+        if node + 1 >= len(offsets):
+            return ()
+        return targets[offsets[node]:offsets[node + 1]]
 
-        Parameters:
-            node (str): node to remove
+    def _reachable(self, node: int, direction: int) -> set[int]:
+        """
+        Collect the nodes reachable from a node, following successors (direction 0) or
+        predecessors (direction 2)
         """
-        if node in self._dependency_graph:
-            del self._dependency_graph[node]
-        for value in self._dependency_graph.values():
-            value.discard(node)
+        reached: set[int] = {node}
+        queue: deque = deque([node])
+        while queue:
+            for neighbour in self._neighbours(queue.popleft(), direction):
+                if neighbour not in reached:
+                    reached.add(neighbour)
+                    queue.append(neighbour)
+        return reached
+
+    def _post_order(self) -> list[int]:
+        """
+        Use dfs from the start node to extract suitable order. The variables are taken in post-order, 
+        so each variable comes after all variables it influences and its statements to the end variable 
+        are built before they are used. The order of a bfs does not ensure this for cross edges
+
+        Returns:
+            order (list[int]): ordered (relevant) variables
+        """
+
+        assert self._start != self._end, "No need to search an order when start == end"
+
+        order: list[int] = []
+        visited: set[int] = {self._start, self._end}
+        stack: list[tuple[int, Iterator[int]]] = []
+        if self._start in self._nodes:
+            stack.append((self._start, iter(self._neighbours(self._start, 0))))
+
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child in self._nodes and child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(self._neighbours(child, 0))))
+                    break
+            else:
+                stack.pop()
+                if node != self._start:
+                    order.append(node)
+
+        return order
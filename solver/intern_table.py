@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from typing import Union
+
+from statement_containers.statement import Statement
+
+
+class InternTable:
+    """
+    Bounded table of canonical statements, so identical statements (e.g. derived again by later solving
+    processes) are a single object. Saves memory and lets set lookups succeed on identity. Statements
+    are tuples, which can not be referenced weakly, so the least recently used statements are evicted
+    once the table is full instead
+
+    Attributes
+    ----------
+    _statements : OrderedDict[Statement, Statement]
+        maps statements to their canonical object, least recently used first
+    _max_size : int
+        maximal amount of statements in the table
+    _lock : threading.Lock
+        allows solvers and their snapshots to share the table across threads
+    """
+
+    def __init__(self, max_size: int):
+        self._statements: OrderedDict[Statement, Statement] = OrderedDict()
+        self._max_size: int = max_size
+        self._lock: threading.Lock = threading.Lock()
+
+    def intern(self, statement: Union[Statement, None]) -> Union[Statement, None]:
+        """
+        Get the canonical object of a statement, adding the statement if not present
+
+        Parameters:
+            statement (Statement/None): statement to intern
+
+        Returns:
+            (Statement/None): canonical statement equal to the given one
+        """
+
+        if statement is None:
+            return None
+
+        with self._lock:
+            canonical: Union[Statement, None] = self._statements.get(statement)
+            if canonical is not None:
+                self._statements.move_to_end(statement)
+                return canonical
+
+            self._statements[statement] = statement
+            if len(self._statements) > self._max_size:
+                self._statements.popitem(last=False)
+            return statement
+
+    def intern_all(self, statements) -> list[Statement]:
+        """
+        Get the canonical objects of multiple statements
+
+        Parameters:
+            statements (iterable[Statement]): statements to intern
+
+        Returns:
+            (list[Statement]): canonical statements, in the order of the given ones
+        """
+
+        return [self.intern(statement) for statement in statements]
+
+    def clear(self):
+        with self._lock:
+            self._statements.clear()
+
+    def __len__(self) -> int:
+        return len(self._statements)
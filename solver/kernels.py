@@ -0,0 +1,121 @@
+from solver.constants import QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, MIN, ADD
+
+
+"""
+Kernels of the rules in rules.py, working on the fields of the statements (floats and qualities)
+instead of statement objects. Results are written into the given columns (buffers) or returned as
+plain values, so no statements are created for candidates that are discarded
+"""
+
+
+def strengthen_sides(begin: list[float], end: list[float], quality: list[str], begin_y: list[float],
+                     end_y: list[float]):
+    """
+    Minimize the height of normalized statements using the (L) and (R) rules, like
+    util.strengthen_interval_height_sides. The i-th entries of the columns form the i-th statement.
+    The rules only change domains, so the results are written into begin_y and end_y
+
+    Parameters:
+        begin, end (list[float]): range intervals of the statements
+        quality (list[str]): qualities of the statements
+        begin_y, end_y (list[float]): domain intervals of the statements, changed in place
+    """
+
+    length: int = len(begin)
+    i: int = 0
+    while i < length:
+        changed: bool = False
+
+        # (L)-rule on statements i and i + 1, changes statement i + 1
+        if i < length - 1:
+            j: int = i + 1
+            if begin[i] <= begin[j] <= end[i]:
+                x, y = begin_y[i], end_y[i]
+                a, b = begin_y[j], end_y[j]
+                q: str = quality[j]
+                new_begin_y, new_end_y = a, b
+                if q == QUALITY_CONS and x < b:
+                    new_begin_y, new_end_y = max(x, a), min(y, b)
+                elif q == QUALITY_MONO and a < x < b:
+                    new_begin_y = x
+                elif q == QUALITY_ANTI and a < y < b:
+                    new_end_y = y
+                # the rule is dropped, if the statement is stronger already
+                if not (a >= new_begin_y and b <= new_end_y):
+                    begin_y[j], end_y[j] = new_begin_y, new_end_y
+                    changed = True
+
+        # (R)-rule on statements i - 1 and i, changes statement i - 1
+        if i > 0:
+            j: int = i - 1
+            if begin[i] <= end[j] <= end[i]:
+                x, y = begin_y[j], end_y[j]
+                a, b = begin_y[i], end_y[i]
+                q: str = quality[j]
+                new_begin_y, new_end_y = x, y
+                if x < b:
+                    if q == QUALITY_CONS:
+                        new_begin_y, new_end_y = max(x, a), min(y, b)
+                    elif q == QUALITY_MONO and b < y:
+                        new_end_y = b
+                elif q == QUALITY_ANTI and x < a < y:
+                    new_begin_y = a
+                if not (x >= new_begin_y and y <= new_end_y):
+                    begin_y[j], end_y[j] = new_begin_y, new_end_y
+                    changed = True
+
+        if changed:
+            i -= 1
+            continue
+        i += 1
+
+
+def strength_multiple(statements) -> tuple[str, float, float]:
+    """
+    Intersect the domains and minimize the qualities of statements, like the (I+)-rule
+
+    Parameters:
+        statements (iterable[Statement]): statements to intersect, at least one
+
+    Returns:
+        (tuple[str, float, float]): quality, begin and end of the domain
+    """
+
+    qualities, begins_y, ends_y = [*zip(*statements)][2:]
+    return fold_qualities(MIN, qualities), max(begins_y), min(ends_y)
+
+
+def join_multiple(statements: list) -> tuple[str, float, float]:
+    """
+    Unite the domains and add the qualities of statements, like the join rule. Does not check
+    if the statements overlap
+
+    Parameters:
+        statements (list[Statement]): statements to join, at least one
+
+    Returns:
+        (tuple[str, float, float]): quality, begin and end of the domain
+    """
+
+    qualities, begins_y, ends_y = [*zip(*statements)][2:]
+    return fold_qualities(ADD, qualities), min(begins_y), max(ends_y)
+
+
+def fold_qualities(table: dict, qualities) -> str:
+    """
+    Combine qualities using a table (MIN or ADD). Both are idempotent, commutative and associative,
+    so each distinct quality is combined only once
+
+    Parameters:
+        table (dict): table of the quality operation
+        qualities (sequence[str]): qualities to combine, at least one
+
+    Returns:
+        (str): combined quality
+    """
+
+    distinct: set[str] = set(qualities)
+    quality: str = distinct.pop()
+    for other in distinct:
+        quality = table[quality][other]
+    return quality
@@ -1,9 +1,9 @@
-from functools import reduce
 from typing import Union
 
 from statement_containers.statement import Statement
 from solver.constants import *
-from solver.util import quality_add, min_quality, quality_times, is_stronger_as
+from solver.kernels import strength_multiple, join_multiple
+from solver.util import quality_times, is_stronger_as
 
 
 """
@@ -91,10 +91,7 @@ def interval_strength_multiple(begin: float, end: float, statements: set[Stateme
         (Statement): Newly created statement 
     """
 
-    begin_y: float = max(st.begin_y for st in statements)
-    end_y: float = min(st.end_y for st in statements)
-    quality: str = reduce(min_quality, (st.quality for st in statements))
-
+    quality, begin_y, end_y = strength_multiple(statements)
     return Statement(begin, end, quality, begin_y, end_y)
 
 
@@ -115,10 +112,7 @@ def interval_join_multiple(statements: list[Statement]) -> Union[Statement, None
         if statements[i].distance_to(statements[i + 1]) > 0:
             return None
 
-    quality: str = reduce(quality_add, (st.quality for st in statements))
-    begin_y: float = min(st.begin_y for st in statements)
-    end_y: float = max(st.end_y for st in statements)
-
+    quality, begin_y, end_y = join_multiple(statements)
     return Statement(statements[0].begin, statements[-1].end, quality, begin_y, end_y)
 
 
@@ -0,0 +1,167 @@
+import math
+from typing import Union
+
+from statement_containers.statement import Statement
+
+
+"""
+Snapping of statement bounds to a grid when they are added. Bounds which differ only by float rounding
+(e.g. accumulated widths in build_model_from_csv) would otherwise create tiny segments in the normalized
+models. The rounding is conservative, so every snapped statement follows from the original one: the
+range interval is shrunk (begin rounded up, end rounded down) and the domain interval is widened (begin
+rounded down, end rounded up). A statement whose range interval contains no grid point is dropped.
+Bounds within a relative tolerance of a grid point are treated as lying on it and moved onto it, in
+either direction. Such a bound may end up on the wrong side of the original one by at most the tolerance,
+which lets touching statements with float noise in their bounds (0.30000000000000004 and 0.3) touch
+again after snapping. With a tolerance of 0, every bound is rounded conservatively
+"""
+
+
+SNAP_TOLERANCE: float = 1e-9
+
+
+def grid_of(grid: Union[float, dict[str, float], None], variable: str) -> Union[float, None]:
+    """
+    Get the grid of a variable
+
+    Parameters:
+        grid (float/dict[str, float]/None): grid of all variables, or grids mapped by variable names
+        variable (str): name of the variable
+
+    Returns:
+        (float/None): grid of the variable, or none if it is not snapped
+    """
+
+    if isinstance(grid, dict):
+        return grid.get(variable)
+    return grid
+
+
+def grid_point(index: int, grid: float) -> float:
+    """
+    Get a point of the grid. For grids 1/n (e.g. 0.1), the index is divided by n, which gives the float
+    nearest to the point (0.3 instead of 3 * 0.1 = 0.30000000000000004)
+
+    Parameters:
+        index (int): index of the point, the point 0 is at 0
+        grid (float): distance of the points
+
+    Returns:
+        (float): point of the grid
+    """
+
+    inverse: int = round(1 / grid)
+    if inverse > 1 and inverse * grid == 1:
+        return index / inverse
+    return index * grid
+
+
+def nearest_point(value: float, grid: float, tolerance: float) -> Union[float, None]:
+    """
+    Get the grid point a value lies on, i.e. the nearest one if it is within the tolerance
+
+    Parameters:
+        value (float): value to check
+        grid (float): distance of the points
+        tolerance (float): maximal distance, relative to the value (and at least to the grid)
+
+    Returns:
+        (float/None): grid point, or none if the value is not within the tolerance of a grid point
+    """
+
+    point: float = grid_point(round(value / grid), grid)
+    if abs(value - point) <= tolerance * max(abs(value), grid):
+        return point
+    return None
+
+
+def snap_down(value: float, grid: float, tolerance: float = SNAP_TOLERANCE) -> float:
+    """
+    Round a value down to the grid, infinite values are kept. The result is only above the value, 
+    if the value is within the tolerance of a grid point (see nearest_point)
+    """
+
+    if not math.isfinite(value):
+        return value
+    point: Union[float, None] = nearest_point(value, grid, tolerance)
+    if point is not None:
+        return point
+    index: int = math.floor(value / grid)
+    while grid_point(index, grid) > value:
+        index -= 1
+    return grid_point(index, grid)
+
+
+def snap_up(value: float, grid: float, tolerance: float = SNAP_TOLERANCE) -> float:
+    """
+    Round a value up to the grid, infinite values are kept. The result is only below the value, 
+    if the value is within the tolerance of a grid point (see nearest_point)
+    """
+
+    if not math.isfinite(value):
+        return value
+    point: Union[float, None] = nearest_point(value, grid, tolerance)
+    if point is not None:
+        return point
+    index: int = math.ceil(value / grid)
+    while grid_point(index, grid) < value:
+        index += 1
+    return grid_point(index, grid)
+
+
+def snap_statement(statement: Statement, grid_x: Union[float, None], grid_y: Union[float, None],
+                   tolerance: float = SNAP_TOLERANCE) -> Union[Statement, None]:
+    """
+    Snap the bounds of a statement
+
+    Parameters:
+        statement (Statement): statement to snap
+        grid_x (float/None): grid of the range interval (influencing variable), none to keep it
+        grid_y (float/None): grid of the domain interval (influenced variable), none to keep it
+        tolerance (float): relative tolerance of bounds treated as lying on a grid point
+
+    Returns:
+        (Statement/None): snapped statement, or none if its range interval contains no grid point
+    """
+
+    begin, end, quality, begin_y, end_y = statement
+    if grid_x is not None:
+        begin, end = snap_up(begin, grid_x, tolerance), snap_down(end, grid_x, tolerance)
+        if begin > end:
+            return None
+    if grid_y is not None:
+        begin_y, end_y = snap_down(begin_y, grid_y, tolerance), snap_up(end_y, grid_y, tolerance)
+    return Statement(begin, end, quality, begin_y, end_y)
+
+
+def snap_columns(grid: Union[float, dict[str, float]], influencing, begin, end, begin_y, end_y, influenced,
+                 tolerance: float = SNAP_TOLERANCE) -> tuple[list, list, list, list, Union[list[bool], None]]:
+    """
+    Snap the bounds of columns of statements
+
+    Parameters:
+        grid (float/dict[str, float]): grid of all variables, or grids mapped by variable names
+        influencing, influenced (sequence[str]): variables of the statements
+        begin, end (sequence[float]): range intervals of the statements
+        begin_y, end_y (sequence[float]): domain intervals of the statements
+        tolerance (float): relative tolerance of bounds treated as lying on a grid point
+
+    Returns:
+        (tuple[list, list, list, list, list[bool]/None]): snapped bounds and the statements to keep,
+            or none if all are kept
+    """
+
+    begin, end, begin_y, end_y = list(begin), list(end), list(begin_y), list(end_y)
+    keep: list[bool] = [True] * len(begin)
+    dropped: bool = False
+    for i in range(len(begin)):
+        grid_x: Union[float, None] = grid_of(grid, influencing[i])
+        if grid_x is not None:
+            begin[i], end[i] = snap_up(begin[i], grid_x, tolerance), snap_down(end[i], grid_x, tolerance)
+            if begin[i] > end[i]:
+                keep[i] = False
+                dropped = True
+        grid_y: Union[float, None] = grid_of(grid, influenced[i])
+        if grid_y is not None:
+            begin_y[i], end_y[i] = snap_down(begin_y[i], grid_y, tolerance), snap_up(end_y[i], grid_y, tolerance)
+    return begin, end, begin_y, end_y, keep if dropped else None
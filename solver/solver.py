@@ -1,13 +1,33 @@
+import asyncio
+import gc
+import pickle
+import threading
 import time
+from operator import itemgetter
+from concurrent.futures import Executor
+from typing import Generator, Union
 
-from plotter.plotter import plot_statements, show_plot
+from statement_containers.domain_index import DomainIndex
 from statement_containers.overlap_map import OverlapMap
 from statement_containers.statement import Statement
 from statement_containers.statement_list_dynamic import StatementListDynamic
 from statement_containers.statement_list_static import IntervalListStatic
-from solver.constants import QUALITY_ANTI, QUALITY_CONS
-from solver.dependency_graph import DependencyGraph
-from solver.rules import transitivity
+from statement_containers.sweep_index import SweepIndex
+from statement_containers.util import sweep_joins
+from solver.constants import QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, STRONGER, TRANSITIVE_CACHE_SIZE, \
+    VALIDATION_STRICT, VALIDATION_REPAIR
+from solver.copy_on_write import CopyOnWriteDict
+from solver.dependency_graph import DependencyGraph, ReducedGraph
+from solver.intern_table import InternTable
+from solver.rules import interval_strength_multiple, rule_fact
+from solver.snapping import SNAP_TOLERANCE, grid_of, snap_columns, snap_statement
+from solver.backend import transitivity
+from solver.compaction import compact_statements
+from solver.budget import Budget, BudgetExhausted, SolveResult
+from solver.stepping import run_steps, run_steps_async
+from solver.symbol_table import SymbolTable
+from solver.transitive_cache import TransitiveCache
+from solver.validation import QUALITIES, validate_statement, validate_columns, repair_columns, filter_columns
 
 
 class Solver:
@@ -16,12 +36,27 @@ class Solver:
 
     Atttibutes
     ----------
-    _tmp_statements : dict[tuple, set]
+    _symbols : SymbolTable
+        Maps variable names to integer ids. Variables are addressed by their id internally
+    _tmp_statements : CopyOnWriteDict
         Used to store statements initially. Main purpose is to maintain 
         statements here in the process of building the model. This is not used in the 
-        solving process. Maps variable pairs to sets of statements
+        solving process. Maps variable pairs (of ids) to sets of statements, which are shared 
+        with snapshots until changed
+    _domain_indices : dict[tuple, DomainIndex]
+        Maps variable pairs (of ids) to indices of their statements on the domain (y-axis), built
+        when first needed and dropped when the statements of the pair change
+    _sweep_indices : dict[tuple, SweepIndex]
+        Maps variable pairs (of ids) to indices of their statements on the range (x-axis), used by the 
+        hypothesis model to normalize only the segments it needs. Built and dropped like _domain_indices
+    _static_models : dict[tuple, IntervalListStatic]
+        Maps variable pairs (of ids) to their normalized models, which do not depend on the hypothesis. 
+        Kept between solving processes and dropped when the statements of the pair change
+    _precomputed : set[tuple]
+        Variable pairs (of ids) passed to 'precompute'. Only their hypotheses are checked with the join 
+        of the static model first, so results do not depend on the models built by earlier solving processes
     _statements : dict[tuple]
-        Maps pairs of variables to sufficient data structures, containing the statements 
+        Maps pairs of variables (of ids) to sufficient data structures, containing the statements 
         related to those variables. Used in the solving process
     _verbose : int
         1 - Prints timings and data to the console
@@ -30,38 +65,171 @@ class Solver:
         Graph containing variables and edges representing the presence of statement(s)
         between them. Used for sanity checks and to extract order for using the 
         transitivity rule
+    _version : int
+        Version of the model, increased with every change of the statements
+    _transitive_cache : TransitiveCache
+        Transitive statements derived in previous solving processes, reused while the 
+        model version is unchanged
+    _intern_table : InternTable
+        Canonical objects of statements, so identical statements are shared. None if disabled
+    _snap : float/dict[str, float]
+        Grid the bounds of added statements are snapped to, for all variables or mapped by variable 
+        names. None if disabled
+    _snap_tolerance : float
+        Relative tolerance of bounds treated as lying on a grid point when snapping
+    _derived : dict[tuple, set]
+        Transitive statements derived in the current solving process, mapped by their variable pair
+    _hypothesis_model : StatementListDynamic
+        Model of the hypothesis pair in the current solving process
+    _budget : Budget
+        Limits of the work of the current solving process, none if unlimited
+    _lock : threading.RLock
+        Synchronizes changes of the model with taking snapshots
     """
 
-    def __init__(self, statements=None, v=None):
+    def __init__(self, statements=None, v=None, cache_size: int = TRANSITIVE_CACHE_SIZE, intern_size: int = 0,
+                 snap: Union[float, dict[str, float]] = None, snap_tolerance: float = SNAP_TOLERANCE):
         """
         Initialize the solver
 
         Parameters:
             v (int): Verbose level
             statements (tuple/container[tuple]): statements to add to the model
+            cache_size (int): maximal amount of derived statements kept between solving processes
+            intern_size (int): maximal amount of statements in the intern table, sharing identical 
+                added and derived statements. Disabled if 0
+            snap (float/dict[str, float]): grid to snap the bounds of added statements to, for all 
+                variables or mapped by variable names (see snapping.py). Disabled if none
+            snap_tolerance (float): relative tolerance of bounds treated as lying on a grid point, 0 to 
+                always round conservatively
         """
 
         self._statements: dict[tuple] = {}
         self._verbose: int = v if v is not None else 0
-        self._dependency_graph: DependencyGraph = DependencyGraph()
-        self._tmp_statements: dict[tuple, set] = {}
+        self._symbols: SymbolTable = SymbolTable()
+        self._dependency_graph: DependencyGraph = DependencyGraph(self._symbols)
+        self._tmp_statements: CopyOnWriteDict = CopyOnWriteDict()
+        self._domain_indices: dict[tuple, DomainIndex] = {}
+        self._sweep_indices: dict[tuple, SweepIndex] = {}
+        self._static_models: dict[tuple, IntervalListStatic] = {}
+        self._precomputed: set[tuple] = set()
+        self._version: int = 0
+        self._transitive_cache: TransitiveCache = TransitiveCache(cache_size)
+        self._intern_table: Union[InternTable, None] = InternTable(intern_size) if intern_size > 0 else None
+        self._snap: Union[float, dict[str, float], None] = snap
+        self._snap_tolerance: float = snap_tolerance
+        self._derived: dict[tuple, set] = {}
+        self._hypothesis_model: Union[StatementListDynamic, None] = None
+        self._budget: Union[Budget, None] = None
+        self._lock: threading.RLock = threading.RLock()
 
         if statements:
             self.add(statements)
 
-    def add(self, statements):
+    def add(self, statements, policy: str = VALIDATION_STRICT):
         """
         Method to add statements to the model
 
         Parameters:
             statements (tuple/container[tuple]): statement(s) to add to the model
+            policy (str): handling of malformed statements (strict, skip or repair), strict throws an exception
         """
 
-        if type(statements) == tuple and type(statements[0]) != tuple:
-            self._add_single_statement(statements)
+        with self._lock:
+            if type(statements) == tuple and type(statements[0]) != tuple:
+                self._add_single_statement(statements, policy)
+                return
+
+            self._add_multiple_statements([*statements], policy)
+
+    def add_bulk(self, statements, policy: str = VALIDATION_STRICT):
+        """
+        Method to add many statements to the model at once. Faster than 'add', because the statements 
+        are validated, grouped by their variable pair and checked for cycles in the dependency graph 
+        as a whole. Throws an exception if a statement is malformed (with strict policy) or a cycle 
+        is created, in which case no statement is added
+
+        Parameters:
+            statements (iterable[tuple]): statements to add to the model
+            policy (str): handling of malformed statements (strict, skip or repair), strict throws an exception
+        """
+
+        statements = [*statements]
+        if not statements:
             return
 
-        self._add_multiple_statements([*statements])
+        first, second = itemgetter(0), itemgetter(1)
+        interval_x: list[tuple[float, float]] = list(map(second, statements))
+        interval_y: list[tuple[float, float]] = list(map(itemgetter(3), statements))
+        self.add_columns(list(map(first, statements)), list(map(first, interval_x)), list(map(second, interval_x)),
+                         list(map(itemgetter(2), statements)), list(map(first, interval_y)),
+                         list(map(second, interval_y)), list(map(itemgetter(4), statements)), policy)
+
+    def add_columns(self, influencing, begin, end, quality, begin_y, end_y, influenced,
+                    policy: str = VALIDATION_STRICT):
+        """
+        Method to add many statements to the model at once, given as columns (e.g. lists or arrays), 
+        where the i-th entries of the columns form a statement. Behaves like 'add_bulk'
+
+        Parameters:
+            influencing, influenced (sequence[str]): variables of the statements
+            begin, end (sequence[float]): range intervals of the statements
+            quality (sequence[str]): qualities of the statements
+            begin_y, end_y (sequence[float]): domain intervals of the statements
+            policy (str): handling of malformed statements (strict, skip or repair), strict throws an exception
+        """
+
+        if len(influencing) != len(begin) or len(influenced) != len(begin):
+            raise ValueError("Columns of the statements differ in length")
+        if policy == VALIDATION_REPAIR:
+            begin, end, quality, begin_y, end_y = repair_columns(begin, end, quality, begin_y, end_y)
+        keep: Union[list[bool], None] = validate_columns(begin, end, quality, begin_y, end_y, policy)
+        if keep is not None:
+            influencing, begin, end, quality, begin_y, end_y, influenced = \
+                filter_columns(keep, influencing, begin, end, quality, begin_y, end_y, influenced)
+        if self._snap is not None:
+            begin, end, begin_y, end_y, keep = snap_columns(self._snap, influencing, begin, end, begin_y, end_y,
+                                                            influenced, self._snap_tolerance)
+            if keep is not None:
+                influencing, begin, end, quality, begin_y, end_y, influenced = \
+                    filter_columns(keep, influencing, begin, end, quality, begin_y, end_y, influenced)
+
+        # group the statements by their variable pair, the garbage collector is paused meanwhile, 
+        # since it would repeatedly traverse the newly created statements
+        grouped: dict[tuple[str, str], set[Statement]] = {}
+        gc_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            statements = map(Statement._make, zip(begin, end, quality, begin_y, end_y))
+            if self._intern_table is not None:
+                statements = map(self._intern_table.intern, statements)
+            for variables, statement in zip(zip(influencing, influenced), statements):
+                group: set[Statement] = grouped.get(variables)
+                if group is None:
+                    group = grouped[variables] = set()
+                group.add(statement)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        with self._lock:
+            selectors: list[tuple[int, int]] = [(self._symbols.intern(a), self._symbols.intern(b)) for a, b in grouped]
+
+            # add the edges and check for cycles once
+            new_edges: list[tuple[int, int]] = [selector for selector in selectors 
+                                                if selector not in self._tmp_statements]
+            for selector in new_edges:
+                self._dependency_graph.add(*selector, check=False)
+            if self._dependency_graph.has_cycle():
+                for selector in new_edges:
+                    self._dependency_graph.remove(*selector)
+                raise Exception(f"Couldn't add statements, because they destroy the implicit partial order.\n "
+                                f"This can be fixed by checking the dependency graph.\n{self._dependency_graph}")
+
+            for selector, group in zip(selectors, grouped.values()):
+                self._tmp_statements.mutable(selector).update(group)
+                self._drop_indices(selector)
+            self._version += 1
 
     def remove(self, statement: tuple):
         """
@@ -71,69 +239,441 @@ class Solver:
             statement (tuple): statement to remove from the model
         """
 
-        selector: tuple[str, str] = statement[0], statement[4]
-        if selector not in self._tmp_statements:
-            raise ValueError
+        variables, internal_statement = to_internal_statement(statement)
+        selector: Union[tuple[int, int], None] = self._get_selector(variables)
+        with self._lock:
+            if selector not in self._tmp_statements or internal_statement not in self._tmp_statements[selector]:
+                raise ValueError(f"Statement {statement} is not in the model")
 
-        self._tmp_statements[selector].remove(statement)
+            self._remove_statements(selector, {internal_statement})
 
     def discard(self, statement: tuple):
         """
-        Method to remove a statement from the model. 
+        Method to remove a statement from the model, if present.
 
         Parameters:
             statement (tuple): statement to remove from the model
         """
 
-        selector: tuple[str, str] = statement[0], statement[4]
-        if selector not in self._tmp_statements:
+        self.remove_many([statement])
+
+    def remove_many(self, statements):
+        """
+        Method to remove multiple statements from the model at once, e.g. to expire old statements. 
+        Statements not present in the model are ignored.
+
+        Parameters:
+            statements (container[tuple]): statements to remove from the model
+        """
+
+        grouped: dict[tuple[int, int], set[Statement]] = {}
+        for statement in statements:
+            variables, internal_statement = to_internal_statement(statement)
+            selector: Union[tuple[int, int], None] = self._get_selector(variables)
+            if selector in self._tmp_statements:
+                grouped.setdefault(selector, set()).add(internal_statement)
+
+        with self._lock:
+            for selector, internal_statements in grouped.items():
+                self._remove_statements(selector, internal_statements)
+
+    def _remove_statements(self, selector: tuple[int, int], statements: set[Statement]):
+        """
+        Remove statements of a variable pair from the model. If no statement of the pair is left, 
+        the pair is removed from the model and the dependency graph. If none of the statements is in 
+        the model, nothing is changed, so the cached transitive statements stay valid
+
+        Parameters:
+            selector (tuple[int, int]): variable pair
+            statements (set[Statement]): statements to remove
+        """
+
+        present: set[Statement] = statements & self._tmp_statements[selector]
+        if not present:
             return
 
-        self._tmp_statements[selector].remove(statement)
+        self._tmp_statements.mutable(selector).difference_update(present)
+        self._drop_indices(selector)
+        if not self._tmp_statements[selector]:
+            del self._tmp_statements[selector]
+            self._dependency_graph.remove(*selector)
+        self._version += 1
+
+    def compact(self) -> int:
+        """
+        Compact the model. Statements of a variable pair with the same quality and domain, which overlap 
+        or touch, are joined, and statements dominated by another statement of the pair are removed. The 
+        compacted statements follow from the original ones, so nothing wrong becomes provable. Pairs with 
+        contradicting statements (see compaction.contradicting) are left unchanged, since removing 
+        dominated statements could lose proofs there. With fewer boundaries, the solving process may 
+        prove hypotheses it missed before
+
+        Returns:
+            (int): amount of statements removed from the model
+        """
+
+        removed: int = 0
+        with self._lock:
+            for selector in list(self._tmp_statements):
+                statements: set[Statement] = self._tmp_statements[selector]
+                compacted: set[Statement] = compact_statements(statements)
+                if compacted == statements:
+                    continue
+
+                removed += len(statements) - len(compacted)
+                mutable: set[Statement] = self._tmp_statements.mutable(selector)
+                mutable.intersection_update(compacted)
+                mutable.update(compacted)
+                self._drop_indices(selector)
+                self._version += 1
+        return removed
+
+    def precompute(self, pairs=None):
+        """
+        Build the normalized models of variable pairs and their join indices ahead of solving. A hypothesis 
+        of a precomputed pair is first checked with the join of the normalized statements overlapping it, 
+        taken from the index in constant time, and only solved if that does not prove it. The models are 
+        kept until the statements of the pair change
 
-    def _add_single_statement(self, statement: tuple):
+        Parameters:
+            pairs (iterable[tuple[str, str]]): variable pairs (influencing, influenced), all pairs if none
+        """
+
+        with self._lock:
+            selectors: list[tuple[int, int]] = list(self._tmp_statements) if pairs is None else \
+                [selector for selector in map(self._get_selector, pairs) if selector in self._tmp_statements]
+            for selector in selectors:
+                if selector not in self._static_models:
+                    self._static_models[selector] = IntervalListStatic(self._tmp_statements[selector])
+                self._static_models[selector].build_index()
+                self._precomputed.add(selector)
+
+    def _add_single_statement(self, statement: tuple, policy: str = VALIDATION_STRICT):
         """
-        Add a statement to the model. Convert it to the internal form and put it into the (tmp)-container under
-        its variable pair
+        Add a statement to the model. Convert it to the internal form, validate it and put it into 
+        the (tmp)-container under its variable pair
 
         Parameters:
             statement (tuple): Statement to add to the model
+            policy (str): handling of a malformed statement
+        """
+
+        variables, internal_statement = to_internal_statement(statement)
+        internal_statement = validate_statement(internal_statement, policy)
+        if internal_statement is not None and self._snap is not None:
+            internal_statement = snap_statement(internal_statement, grid_of(self._snap, variables[0]),
+                                                grid_of(self._snap, variables[1]), self._snap_tolerance)
+        if internal_statement is None:
+            return
+        if self._intern_table is not None:
+            internal_statement = self._intern_table.intern(internal_statement)
+        selector: tuple[int, int] = self._symbols.intern(variables[0]), self._symbols.intern(variables[1])
+        self._dependency_graph.add(*selector)
+        self._tmp_statements.mutable(selector).add(internal_statement)
+        self._drop_indices(selector)
+        self._version += 1
+
+    def _drop_indices(self, selector: tuple[int, int]):
         """
+        Drop the data structures built from the statements of a variable pair, after they changed
 
-        influencing: str = statement[0]
-        influenced: str = statement[4]
-        self._dependency_graph.add(influencing, influenced)
+        Parameters:
+            selector (tuple[int, int]): variable pair
+        """
+
+        self._domain_indices.pop(selector, None)
+        self._sweep_indices.pop(selector, None)
+        self._static_models.pop(selector, None)
+        self._precomputed.discard(selector)
+
+    def _precomputed_model(self, selector: tuple[int, int]) -> Union[IntervalListStatic, None]:
+        """
+        Get the static model of a precomputed variable pair. Static models built by solving processes 
+        are not used, so the fast path does not depend on earlier hypotheses
+
+        Parameters:
+            selector (tuple[int, int]): variable pair
+
+        Returns:
+            (IntervalListStatic/None): static model, or none if the pair is not precomputed
+        """
+
+        return self._static_models.get(selector) if selector in self._precomputed else None
+
+    def _get_selector(self, variables: tuple[str, str]) -> Union[tuple[int, int], None]:
+        """
+        Get the ids of a variable pair
 
-        quality: str = statement[2]
-        interval_x: tuple[float, float] = statement[1]
-        interval_y: tuple[float, float] = statement[3]
+        Parameters:
+            variables (tuple[str, str]): names of the variables
 
-        selector: tuple[str, str] = (influencing, influenced)
-        if selector not in self._tmp_statements:
-            self._tmp_statements[selector] = set()
+        Returns:
+            (tuple[int, int]/None): ids of the variables, or none if a variable is unknown
+        """
 
-        internal_statement: Statement = Statement(interval_x[0], interval_x[1], quality, interval_y[0], interval_y[1])
-        self._tmp_statements[selector].add(internal_statement)
+        a, b = self._symbols.get(variables[0]), self._symbols.get(variables[1])
+        if a is None or b is None:
+            return None
+        return a, b
 
-    def _add_multiple_statements(self, statements: list[tuple]):
+    def _add_multiple_statements(self, statements: list[tuple], policy: str = VALIDATION_STRICT):
         """
         Adds multiple statements to the model
 
         Parameters:
             statements (list[tuple]): statements to add
+            policy (str): handling of malformed statements
         """
 
         for statement in statements:
-            self._add_single_statement(statement)
+            self._add_single_statement(statement, policy)
 
-    def solve(self, hypothesis: tuple, v=None) -> bool:
+    def solve(self, hypothesis: tuple, v=None, deadline: float = None, max_derived: int = None,
+              max_rule_applications: int = None) -> Union[bool, SolveResult]:
         """
         Main method to start the solving method. Takes a hypothesis and tries to prove it using 
-        the model and the proof rules. 
+        the model and the proof rules. The work can be limited by a budget, in which case the 
+        composition of transitive statements stops once a limit is exceeded, and the hypothesis is 
+        checked with the statements derived so far
 
         Parameters:
             hypothesis (tuple): Hypothesis to check
             v (int): Verbose level
+            deadline (float): maximal solving time (in seconds)
+            max_derived (int): maximal amount of derived statements
+            max_rule_applications (int): maximal amount of applications of the transitivity rule
+
+        Returns:
+            (bool): Hypothesis being derivable by the model, if no limit is given
+            (SolveResult): proven, not proven or unknown (limit exceeded) and the consumed budget, 
+                if a limit is given
+        """
+
+        if deadline is None and max_derived is None and max_rule_applications is None:
+            return run_steps(self._solve_steps(hypothesis, v, {}))
+
+        budget: Budget = Budget(deadline, max_derived, max_rule_applications)
+        return budget.result(run_steps(self._solve_steps(hypothesis, v, {}, budget)))
+
+    async def solve_async(self, hypothesis: tuple, timeout: float = None, executor: Executor = None, 
+                          v=None) -> bool:
+        """
+        Check a hypothesis without blocking the event loop. The solving process runs in an executor on a 
+        snapshot of the model, yielding to the event loop between its phases (initial solving, each 
+        composition of transitive statements, final solving). If cancelled or timed out, it stops after 
+        the running phase
+
+        Parameters:
+            hypothesis (tuple): Hypothesis to check
+            timeout (float): maximal solving time (in seconds), raises asyncio.TimeoutError if exceeded
+            executor (Executor): executor to solve in, the default one of the event loop if not given
+            v (int): Verbose level
+
+        Returns:
+            (bool): Hypothesis being derivable by the model
+        """
+
+        snapshot: SolverSnapshot = self.snapshot()
+        return await asyncio.wait_for(run_steps_async(snapshot._solve_steps(hypothesis, v, {}), executor), timeout)
+
+    async def solve_many_async(self, hypotheses: list[tuple], timeout: float = None, executor: Executor = None, 
+                               v=None) -> list[bool]:
+        """
+        Check multiple hypotheses without blocking the event loop, like 'solve_many'. See 'solve_async'
+
+        Parameters:
+            hypotheses (list[tuple]): Hypotheses to check
+            timeout (float): maximal solving time of all hypotheses (in seconds), raises 
+                asyncio.TimeoutError if exceeded
+            executor (Executor): executor to solve in, the default one of the event loop if not given
+            v (int): Verbose level
+
+        Returns:
+            (list[bool]): Hypotheses being derivable by the model, in the order of the hypotheses
+        """
+
+        snapshot: SolverSnapshot = self.snapshot()
+        return await asyncio.wait_for(run_steps_async(snapshot._solve_many_steps(hypotheses, v), executor), timeout)
+
+    def tightest(self, influencing: str, x_interval: tuple[float, float], quality: str, influenced: str,
+                 v=None) -> Union[tuple, None]:
+        """
+        Get a narrow statement derivable for a range interval with at least the given quality, instead of 
+        searching it by solving hypotheses with shrinking domains. The statement is the join of the 
+        normalized statements overlapping the range after building the transitive cover, like in the 
+        solving process of a hypothesis with an unbounded domain, intersected with the join of the static 
+        model of the pair (the precomputed one, if any). The statement is derivable, but not necessarily 
+        the tightest one: a hypothesis with a narrower domain may still be proven by solving it
+
+        Parameters:
+            influencing, influenced (str): variables of the statement
+            x_interval (tuple[float, float]): range interval of the statement
+            quality (str): weakest quality of the statement
+            v (int): Verbose level
+
+        Returns:
+            (tuple/None): statement of the pattern tuple[str, tuple[float, float], str, tuple[float, float], str], 
+                or none if no statement of the quality envelops the range. An empty domain (begin > end) means 
+                the statements contradict each other on the range
+        """
+
+        if quality not in QUALITIES:
+            raise ValueError(f"Unknown quality: {quality}")
+        x_interval = tuple(x_interval)
+
+        # the identity, if its quality is strong enough
+        if influencing == influenced:
+            if not STRONGER[QUALITY_MONO][quality]:
+                return None
+            return influencing, x_interval, QUALITY_MONO, x_interval, influenced
+
+        selector: Union[tuple[int, int], None] = self._get_selector((influencing, influenced))
+        if selector is None:
+            return None
+
+        hypothesis: tuple = (influencing, x_interval, quality, (float("-inf"), float("inf")), influenced)
+        run_steps(self._solve_steps(hypothesis, v, {}, fast_path=False))
+        static_model: Union[IntervalListStatic, None] = self._static_models.get(selector)
+        if static_model is None:
+            static_model = IntervalListStatic(self._tmp_statements.get(selector, set()))
+        envelopes: list[Union[Statement, None]] = [self._hypothesis_model.slimest_envelopping(),
+                                                   static_model.slimest_statement(*x_interval)]
+
+        # the envelopes are weakened to the range and intersected
+        envelopes = [st for st in envelopes if st is not None and st.enveloping(*x_interval)]
+        if not envelopes:
+            return None
+        statement: Statement = interval_strength_multiple(x_interval[0], x_interval[1], envelopes)
+        if not STRONGER[statement.quality][quality]:
+            return None
+        return influencing, x_interval, statement.quality, (statement.begin_y, statement.end_y), influenced
+
+    def sweep(self, influencing: str, windows: list[tuple[float, float]], quality: str, y_interval: tuple[float, float],
+              influenced: str, v=None) -> list[bool]:
+        """
+        Check a hypothesis for multiple range intervals (windows), e.g. every 10 m of altitude. Instead of 
+        solving each window, the hypothesis spanning all windows is solved once and its normalized 
+        statements are joined for each window in a single pass (see util.sweep_joins). The windows 
+        are sorted by begin and end, so the joined statement is updated as the window slides. Windows 
+        not proven by the sweep are solved one by one, so the sweep is fastest if most windows hold. 
+        Every window proven by 'solve' is proven by the sweep as well, but the sweep can prove more: 
+        the statements of the spanning hypothesis are normalized and strengthened with their neighbours 
+        over all windows, which can narrow the domain within a window beyond what solving it alone derives
+
+        Parameters:
+            influencing, influenced (str): variables of the hypothesis
+            windows (list[tuple[float, float]]): range intervals of the hypothesis, sorted by begin and end
+            quality (str): quality of the hypothesis
+            y_interval (tuple[float, float]): domain interval of the hypothesis
+            v (int): Verbose level
+
+        Returns:
+            (list[bool]): Hypothesis being derivable by the model for each window, in the order of the windows
+        """
+
+        if quality not in QUALITIES:
+            raise ValueError(f"Unknown quality: {quality}")
+        windows = [tuple(window) for window in windows]
+        y_interval = tuple(y_interval)
+        for i, (begin, end) in enumerate(windows):
+            if begin > end:
+                raise ValueError(f"Window {i} has begin > end: {(begin, end)}")
+            if i > 0 and (begin < windows[i - 1][0] or end < windows[i - 1][1]):
+                raise ValueError(f"Windows are not sorted by begin and end at window {i}")
+        if not windows:
+            return []
+
+        if influencing == influenced:
+            return [check_reflexive_hypothesis(window, quality, y_interval) for window in windows]
+
+        selector: Union[tuple[int, int], None] = self._get_selector((influencing, influenced))
+        if selector is None:
+            return [False] * len(windows)
+
+        graphs: dict[tuple[int, int], ReducedGraph] = {}
+        hypothesis: tuple = (influencing, (windows[0][0], windows[-1][1]), quality, y_interval, influenced)
+        run_steps(self._solve_steps(hypothesis, v, graphs, fast_path=False))
+        joins: list[Union[Statement, None]] = sweep_joins(self._hypothesis_model.get_segments(), windows)
+
+        static_model: Union[IntervalListStatic, None] = self._precomputed_model(selector)
+        results: list[bool] = []
+        for window, statement in zip(windows, joins):
+            window_hypothesis: tuple = (influencing, window, quality, y_interval, influenced)
+            proven: bool = rule_fact(window_hypothesis, statement) or static_model is not None and \
+                rule_fact(window_hypothesis, static_model.slimest_statement(*window))
+
+            # the spanning hypothesis is only normalized as far as it needs, solving the window alone may 
+            # strengthen its segments with statements the sweep did not build
+            if not proven:
+                proven = run_steps(self._solve_steps(window_hypothesis, v, graphs))
+            results.append(proven)
+        return results
+
+    def solve_many(self, hypotheses: list[tuple], v=None) -> list[bool]:
+        """
+        Check multiple hypotheses. Hypotheses of the same variable pair and window (range and domain), 
+        which differ only in their quality, share one solving process: the normalization and the transitive 
+        cover do not depend on the quality, so each of them is checked against the same joined statement. 
+        Different windows of a pair are solved one after another, sharing the reduced dependency graph and 
+        the models kept between solving processes. Within a pair, windows with the same domain are solved 
+        widest first, so the transitive statements derived for one are reused from the cache by the 
+        enveloped ones
+
+        Parameters:
+            hypotheses (list[tuple]): Hypotheses to check
+            v (int): Verbose level
+
+        Returns:
+            (list[bool]): Hypotheses being derivable by the model, in the order of the hypotheses
+        """
+
+        return run_steps(self._solve_many_steps(hypotheses, v))
+
+    def _solve_many_steps(self, hypotheses: list[tuple], v) -> Generator[None, None, list[bool]]:
+        """
+        Check multiple hypotheses step by step, see 'solve_many' and '_solve_steps'
+        """
+
+        graphs: dict[tuple[int, int], ReducedGraph] = {}
+        results: list[bool] = [False] * len(hypotheses)
+        windows: dict[tuple, list[int]] = {}
+        for i, hypothesis in enumerate(hypotheses):
+            if hypothesis[2] not in QUALITIES:
+                raise ValueError(f"Hypothesis has an unknown quality: {hypothesis[2]}")
+            windows.setdefault((hypothesis[0], tuple(hypothesis[1]), tuple(hypothesis[3]), hypothesis[4]), []).append(i)
+
+        for influencing, x_interval, y_interval, influenced in sorted(windows, key=lambda w: (w[0], w[3], w[2], 
+                                                                                             w[1][0], -w[1][1])):
+            indices: list[int] = windows[(influencing, x_interval, y_interval, influenced)]
+            if len(indices) == 1 or influencing == influenced or \
+                    self._get_selector((influencing, influenced)) is None:
+                for i in indices:
+                    results[i] = yield from self._solve_steps(hypotheses[i], v, graphs)
+                continue
+
+            # the window is solved once, each quality is checked against its joined statement
+            yield from self._solve_steps(hypotheses[indices[0]], v, graphs, fast_path=False)
+            envelope: Union[Statement, None] = self._hypothesis_model.slimest_envelopping()
+            static_model: Union[IntervalListStatic, None] = \
+                self._precomputed_model(self._get_selector((influencing, influenced)))
+            for i in indices:
+                results[i] = rule_fact(hypotheses[i], envelope) or static_model is not None and \
+                    rule_fact(hypotheses[i], static_model.slimest_statement(*x_interval))
+        return results
+
+    def _solve_steps(self, hypothesis: tuple, v, graphs: dict[tuple[int, int], ReducedGraph], 
+                     budget: Budget = None, fast_path: bool = True) -> Generator[None, None, bool]:
+        """
+        Check a hypothesis, see 'solve'. The solving process yields between its phases, so it can be 
+        interleaved with other work (see stepping.py)
+
+        Parameters:
+            hypothesis (tuple): Hypothesis to check
+            v (int): Verbose level
+            graphs (dict[tuple[int, int], ReducedGraph]): reduced dependency graphs of variable pairs, 
+                shared by the hypotheses of a batch
+            budget (Budget): limits of the work, none if unlimited
+            fast_path (bool): try proving the hypothesis with the precomputed model of the pair first
 
         Returns:
             (bool): Hypothesis being derivable by the model
@@ -141,67 +681,150 @@ class Solver:
 
         if v is not None:
             self._verbose = v
+        self._budget = budget
 
         # extract data
         adding_time_start: float = time.time()
-        influencing: str = hypothesis[0]
-        influenced: str = hypothesis[4]
         y_lower, y_upper = hypothesis[3]
 
+        if hypothesis[2] not in QUALITIES:
+            raise ValueError(f"Hypothesis has an unknown quality: {hypothesis[2]}")
+
         # check special case
-        if influencing == influenced:
+        if hypothesis[0] == hypothesis[4]:
             return check_reflexive_hypothesis(hypothesis[1], hypothesis[2], hypothesis[3])
 
+        # variables without statements
+        selector: Union[tuple[int, int], None] = self._get_selector((hypothesis[0], hypothesis[4]))
+        if selector is None:
+            return False
+        influencing, influenced = selector
+
+        # the precomputed model of the pair may prove the hypothesis already, by joining its statements
+        static_model: Union[IntervalListStatic, None] = self._precomputed_model(selector)
+        if fast_path and static_model is not None and \
+                rule_fact(hypothesis, static_model.slimest_statement(*hypothesis[1])):
+            return True
+
         # extract order and initialize models
-        order = self._dependency_graph.setup(influencing, influenced)
-        used_variables: list[str] = order + [influencing, influenced]
-        if (influencing, influenced) not in self._tmp_statements:
-            self._tmp_statements[(influencing, influenced)] = set()
-        keys: set[tuple] = {key for key in self._tmp_statements if key[0] in used_variables and key[1] in used_variables}
+        if selector not in graphs:
+            graphs[selector] = self._dependency_graph.setup(influencing, influenced)
+        graph: ReducedGraph = graphs[selector].copy()
+        order: list[int] = graph.order
+        self._statements = {}
+        keys: set[tuple] = set(graph.get_edges())
+        keys.add((influencing, influenced))
         for key in keys:
-            statements: set[Statement] = {st for st in self._tmp_statements[key] if st.overlaps_y(y_lower, y_upper)} \
-                if key[1] == influenced else self._tmp_statements[key]
+            if key == (influencing, influenced):
+                self._statements[key] = self._hypothesis_model = self._hypothesis_list(key, hypothesis)
+                continue
+            statements: set[Statement] = self._overlapping_y(key, y_lower, y_upper) \
+                if key[1] == influenced else self._tmp_statements.get(key, set())
             if key[1] == influenced and key[0] != influencing:
                 self._statements[key] = OverlapMap(statements)
                 continue
-            if key == (influencing, influenced):
-                self._statements[key] = StatementListDynamic(hypothesis, statements)
-                continue
-            self._statements[key] = IntervalListStatic(statements)
+            if key not in self._static_models:
+                self._static_models[key] = IntervalListStatic(statements)
+            self._statements[key] = self._static_models[key]
         adding_time: float = time.time() - adding_time_start
 
         solve_time_start: float = time.time()
         if self._verbose >= 3:
-            plot_statements(self._tmp_statements, list(self._tmp_statements.keys()))
-        start_amount: int = sum(len(self._tmp_statements[ivs]) for ivs in self._tmp_statements)
+            self.plot(initial=True, show=False)
+        # only printed, so the pairs are not counted on every solving process
+        start_amount: int = 0
+        if self._verbose >= 1:
+            start_amount = sum(len(statements) for statements in self._tmp_statements.values())
+
+        yield
 
         # try to solve
-        instance = StatementListDynamic.get_instance()
-        result, initial_solving_time = instance.solve()
-        if result:
+        instance: StatementListDynamic = self._hypothesis_model
+        initial_result, initial_solving_time = instance.solve()
+        if initial_result:
             self._print_result(adding_time, time.time() - solve_time_start, initial_solving_time, True, start_amount)
         instance.reset()
+        yield
 
-        # build transitives
+        # build transitives, the statements derived before a budget is exhausted are kept
         transitive_time_start: float = time.time()
-        self._build_transitive_cover(order, hypothesis)
+        try:
+            yield from self._build_transitive_cover(order, hypothesis, graph)
+        except BudgetExhausted:
+            pass
         transitive_time: float = time.time() - transitive_time_start
 
         # try solving again
         result, final_solving_time = instance.solve()
+        if budget is not None and budget.exhausted:
+            result = result or initial_result
         solve_time: float = time.time() - solve_time_start
 
         self._print_result(adding_time, solve_time, initial_solving_time, result, start_amount,
                            transitive_time, final_solving_time)
         return result
 
+    def _overlapping_y(self, key: tuple[int, int], y_lower: float, y_upper: float) -> set[Statement]:
+        """
+        Get the statements of a variable pair overlapping a domain interval, using the domain index of the pair
+
+        Parameters:
+            key (tuple[int, int]): variable pair
+            y_lower (float): begin of the domain interval
+            y_upper (float): end of the domain interval
+
+        Returns:
+            (set[Statement]): overlapping statements
+        """
+
+        if key not in self._tmp_statements:
+            return set()
+        return self._domain_index(key).overlapping(y_lower, y_upper)
+
+    def _domain_index(self, key: tuple[int, int]) -> DomainIndex:
+        """
+        Get (and build if needed) the domain index of a variable pair with statements
+        """
+
+        index: DomainIndex = self._domain_indices.get(key)
+        if index is None:
+            index = self._domain_indices[key] = DomainIndex(self._tmp_statements[key])
+        return index
+
+    def _hypothesis_list(self, key: tuple[int, int], hypothesis: tuple) -> StatementListDynamic:
+        """
+        Build the model of the hypothesis pair. If most statements of the pair overlap the domain of the 
+        hypothesis, the model sweeps the range index of the pair (built once) and skips the others, so 
+        the work scales with the segments it normalizes. Otherwise the few overlapping statements are 
+        extracted and indexed by the model
+
+        Parameters:
+            key (tuple[int, int]): hypothesis pair
+            hypothesis (tuple): hypothesis to check
+
+        Returns:
+            (StatementListDynamic): model of the hypothesis pair
+        """
+
+        if key not in self._tmp_statements:
+            return StatementListDynamic(hypothesis, set())
+        y_lower, y_upper = hypothesis[3]
+        domain_index: DomainIndex = self._domain_index(key)
+        if 2 * domain_index.count(y_lower, y_upper) < len(domain_index):
+            return StatementListDynamic(hypothesis, domain_index.overlapping(y_lower, y_upper))
+
+        index: SweepIndex = self._sweep_indices.get(key)
+        if index is None:
+            index = self._sweep_indices[key] = SweepIndex(self._tmp_statements[key])
+        return StatementListDynamic(hypothesis, self._tmp_statements[key], index)
+
     def _print_result(self, adding_time: float, solve_time: float, initial_solving_time: float, result: bool,
                       amount: int, transitive_time: float = None, final_solving_time: float = None):
         """
         Prints timing data and further information of the solving process 
         """
 
-        instance = StatementListDynamic.get_instance()
+        instance: StatementListDynamic = self._hypothesis_model
         if self._verbose >= 1:
             adding: str = f"Adding statements time:      {adding_time}s"
             total: str = f"Total solving time:          {solve_time}s"
@@ -231,30 +854,90 @@ class Solver:
             print("can be solved" if result else "is not solvable")
 
         if self._verbose >= 2:
-            plot_statements(self._statements, list(self._statements.keys()))
+            self.plot()
+
+    def plot(self, initial: bool = False, show: bool = True):
+        """
+        Plot the model using matplotlib. The plotter (and matplotlib) is imported on the first call, 
+        so the solver can be used without matplotlib
+
+        Parameters:
+            initial (bool): plot the added statements instead of the models of the last solving process
+            show (bool): show the plots
+        """
+
+        from plotter.plotter import plot_statements, show_plot
+
+        containers: dict = self._named(self._tmp_statements if initial else self._statements)
+        hypothesis: Union[tuple, None] = self._hypothesis_model.hypothesis if self._hypothesis_model else None
+        plot_statements(containers, list(containers.keys()), hypothesis)
+        if show:
             show_plot()
 
-    def _build_transitive_cover(self, order: list[str], hypothesis: tuple):
+    def _named(self, containers: dict) -> dict:
+        """
+        Map containers by the names of their variable pairs instead of the ids
+        """
+
+        return {self._symbols.names(key): container for key, container in containers.items()}
+
+    def get_hypothesis_model(self) -> StatementListDynamic:
+        """
+        Get the model of the hypothesis pair in the current (or last) solving process
+
+        Returns:
+            (StatementListDynamic): model of the hypothesis pair
+        """
+
+        return self._hypothesis_model
+
+    def _build_transitive_cover(self, order: list[int], hypothesis: tuple, graph: ReducedGraph) -> Generator:
         """
-        Build tranistive cover using the extracted order
+        Build tranistive cover using the extracted order. Statements derived for a variable pair 
+        in previous solving processes are taken from the cache instead of being composed again. 
+        Yields after each composition of two models
 
         Parameters:
-            order (list[str]): order of the variables
+            order (list[int]): order of the variables
             hypothesis (tuple): hypothesis containg information about the start/end variables
+            graph (ReducedGraph): reduced dependency graph of the hypothesis
         """
-        goal: str = hypothesis[4]
+        start, goal = self._get_selector((hypothesis[0], hypothesis[4]))
+        x_window, y_window = hypothesis[1], hypothesis[3]
+
+        # use cached statements
+        cached: set[int] = set()
+        for var in order + [start]:
+            statements = self._transitive_cache.get((var, goal), self._version, x_window, y_window)
+            if statements is None:
+                continue
+            cached.add(var)
+            if (var, goal) not in self._statements:
+                self._statements[(var, goal)] = OverlapMap()
+            for st in statements:
+                self._statements[(var, goal)].add(st)
 
+        self._derived = {}
         for node in order:
-            for pre in self._dependency_graph.get_pre(node):
-                self._build_transitives(pre, node, goal)
-                self._dependency_graph.remove_node(node)
+            for pre in graph.get_pre(node):
+                if pre not in cached:
+                    self._build_transitives(pre, node, goal)
+                    if self._budget is not None:
+                        self._budget.charge()
+                    yield
+                graph.remove_node(node)
+
+        for var in order + [start]:
+            if var not in cached:
+                self._transitive_cache.put((var, goal), self._version, x_window, y_window,
+                                           tuple(self._derived.get((var, goal), ())))
 
-    def _build_transitives(self, a: str, b: str, c: str):
+    def _build_transitives(self, a: int, b: int, c: int):
         """
         Build important statements using transitivity rule
 
         Parameters: 
-            a, b, c (str): Variables to use transitivity rule on its statements 
+            a, b, c (int): Variables to use transitivity rule on its statements 
         """
 
         model_ab: IntervalListStatic = self._statements[(a, b)]
@@ -265,7 +948,7 @@ class Solver:
 
         model_ab.interval_height_and_transitives(self, model_bc, a, c)
 
-    def create_transitive_from_statement(self, st: Statement, model: OverlapMap, a: str, c: str):
+    def create_transitive_from_statement(self, st: Statement, model: OverlapMap, a: int, c: int):
         """
         Use transitivity rule on a given statement. Check which statements in the next model overlap the statement 
         and build one enveloping it by using join rule, followed by the transitivity rule
@@ -273,17 +956,126 @@ class Solver:
         Parameters:
             st (Statement): statement used in the left side of the transitivity rule
             model (OverlapMap): model containing statements to search in
-            a, c (str): variables of the (possibly new) influence
+            a, c (int): variables of the (possibly new) influence
         """
+        if self._budget is not None:
+            self._budget.charge(1)
         overlapping = model.slimest_statement(st.begin_y, st.end_y)
         if overlapping is None:
             return
         rule: Statement = transitivity(st, overlapping)
-        added: bool = self._statements[(a, c)].add(rule)
-        if added:
-            self._dependency_graph.add(a, c, check=False)
+        if self._intern_table is not None:
+            rule = self._intern_table.intern(rule)
+        self._add_derived(rule, a, c)
         return rule
 
+    def create_transitives_from_statements(self, sts: list[Statement], model: OverlapMap, a: int,
+                                           c: int) -> list[Union[Statement, None]]:
+        """
+        Use transitivity rule on multiple statements at once. The enveloping statements of the next model 
+        are searched for all statements in a single sweep, instead of one search per statement
+
+        Parameters:
+            sts (list[Statement]): statements used in the left side of the transitivity rule
+            model (OverlapMap): model containing statements to search in
+            a, c (int): variables of the (possibly new) influence
+
+        Returns:
+            (list[Statement/None]): created statement for each given statement
+        """
+
+        # with a budget, as many statements are used as the remaining rule applications allow
+        allowed: int = len(sts) if self._budget is None else self._budget.charge_partial(len(sts))
+        created: list[Union[Statement, None]] = []
+        for st, overlapping in zip(sts[:allowed], model.slimest_statements([(st.begin_y, st.end_y)
+                                                                            for st in sts[:allowed]])):
+            rule: Union[Statement, None] = None if overlapping is None else transitivity(st, overlapping)
+            if self._intern_table is not None:
+                rule = self._intern_table.intern(rule)
+            self._add_derived(rule, a, c)
+            created.append(rule)
+
+        # the remaining statements exceed the limit, which stops the solving process
+        if allowed < len(sts):
+            self._budget.charge(len(sts) - allowed)
+        return created
+
+    def _add_derived(self, rule: Union[Statement, None], a: int, c: int):
+        """
+        Add a derived statement to the model of (a, c) and remember it for the cache
+
+        Parameters:
+            rule (Statement/None): derived statement
+            a, c (int): variables of the influence
+        """
+
+        if self._statements[(a, c)].add(rule):
+            if (a, c) not in self._derived:
+                self._derived[(a, c)] = set()
+            self._derived[(a, c)].add(rule)
+            if self._budget is not None:
+                self._budget.charge(derived=1)
+
+    def save(self, path: str):
+        """
+        Write the statements of the model to a binary file, which can be loaded using 'load'. 
+        The statements are stored as columns per variable pair
+
+        Parameters:
+            path (str): path of the file
+        """
+
+        with self._lock:
+            model: dict[tuple[str, str], tuple] = {self._symbols.names(pair): tuple(zip(*statements))
+                                                   for pair, statements in self._tmp_statements.items()}
+        with open(path, "wb") as file:
+            pickle.dump(model, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path: str, v=None, cache_size: int = TRANSITIVE_CACHE_SIZE,
+             snap: Union[float, dict[str, float]] = None, snap_tolerance: float = SNAP_TOLERANCE) -> 'Solver':
+        """
+        Build a solver from a binary file written by 'save'
+
+        Parameters:
+            path (str): path of the file
+            v (int): Verbose level
+            cache_size (int): maximal amount of derived statements kept between solving processes
+            snap (float/dict[str, float]): grid to snap the bounds of the statements to
+            snap_tolerance (float): relative tolerance of bounds treated as lying on a grid point
+
+        Returns:
+            (Solver): solver containing the statements of the file
+        """
+
+        with open(path, "rb") as file:
+            model: dict[tuple[str, str], tuple] = pickle.load(file)
+
+        columns: list[list] = [[] for _ in range(7)]
+        for (a, b), (begin, end, quality, begin_y, end_y) in model.items():
+            columns[0].extend([a] * len(begin))
+            for column, values in zip(columns[1:6], (begin, end, quality, begin_y, end_y)):
+                column.extend(values)
+            columns[6].extend([b] * len(begin))
+
+        solver: Solver = Solver(v=v, cache_size=cache_size, snap=snap, snap_tolerance=snap_tolerance)
+        if model:
+            solver.add_columns(*columns)
+        return solver
+
+    def snapshot(self) -> 'SolverSnapshot':
+        """
+        Take a snapshot of the model. The snapshot can not be changed and is not affected by later 
+        changes of this solver, so hypotheses can be checked on it while statements are added. 
+        Statements and the dependency graph are shared, until this solver changes them
+
+        Returns:
+            (SolverSnapshot): snapshot of the model
+        """
+
+        with self._lock:
+            return SolverSnapshot(self)
+
     def __len__(self):
         length: int = 0
         for model in self._statements:
@@ -291,7 +1083,71 @@ class Solver:
         return length
 
     def __str__(self):
-        return str(self._statements)
+        return str(self._named(self._statements))
+
+
+class SolverSnapshot(Solver):
+    """
+    Unchangeable view of the model of a solver at the time the snapshot was taken. 
+    Hypotheses are checked like with the solver itself
+    """
+
+    def __init__(self, solver: Solver):
+        """
+        Initialize the snapshot, sharing the model with the solver
+
+        Parameters:
+            solver (Solver): solver to take the snapshot of
+        """
+
+        super().__init__(v=solver._verbose)
+        self._tmp_statements = solver._tmp_statements.copy()
+        self._domain_indices = dict(solver._domain_indices)
+        self._sweep_indices = dict(solver._sweep_indices)
+        self._static_models = dict(solver._static_models)
+        self._precomputed = set(solver._precomputed)
+        self._dependency_graph = solver._dependency_graph.copy()
+        self._version = solver._version
+        self._transitive_cache = solver._transitive_cache
+        self._intern_table = solver._intern_table
+        self._symbols = solver._symbols
+
+    def add(self, statements, policy: str = VALIDATION_STRICT):
+        raise TypeError("Statements can not be added to a snapshot")
+
+    def add_columns(self, influencing, begin, end, quality, begin_y, end_y, influenced,
+                    policy: str = VALIDATION_STRICT):
+        raise TypeError("Statements can not be added to a snapshot")
+
+    def remove(self, statement: tuple):
+        raise TypeError("Statements can not be removed from a snapshot")
+
+    def remove_many(self, statements):
+        raise TypeError("Statements can not be removed from a snapshot")
+
+    def compact(self) -> int:
+        raise TypeError("A snapshot can not be compacted")
+
+    def snapshot(self) -> 'SolverSnapshot':
+        return self
+
+
+def to_internal_statement(statement: tuple) -> tuple[tuple[str, str], Statement]:
+    """
+    Convert a statement to its internal form
+
+    Parameters:
+        statement (tuple): statement of the pattern tuple[str, tuple[float, float], str, tuple[float, float], str]
+
+    Returns:
+        (tuple[str, str]): variable pair of the statement
+        (Statement): internal statement
+    """
+
+    interval_x: tuple[float, float] = statement[1]
+    interval_y: tuple[float, float] = statement[3]
+    return (statement[0], statement[4]), Statement(interval_x[0], interval_x[1], statement[2], 
+                                                   interval_y[0], interval_y[1])
 
 
 def check_reflexive_hypothesis(x_interval: tuple[float, float], quality: str, y_interval: tuple[float, float]) -> bool:
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from concurrent.futures import Executor
+from typing import Generator
+
+
+"""
+Runs solving processes given as generators, which yield between their phases (initial solving, each
+composition of transitive statements, final solving) and return the result. Synchronously, the steps
+are run one after another. Asynchronously, each step is run in an executor, so the event loop is only
+blocked between steps, and the process is stopped after the running step when it is cancelled
+"""
+
+
+def run_steps(steps: Generator):
+    """
+    Run all steps of a solving process
+
+    Parameters:
+        steps (Generator): steps of the solving process
+
+    Returns:
+        result of the solving process
+    """
+
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
+
+
+class StepRunner:
+    """
+    Runs the steps of a solving process one at a time, possibly from different threads
+
+    Attributes
+    ----------
+    _steps : Generator
+        steps of the solving process
+    _lock : threading.Lock
+        held while a step runs, so the steps are not closed meanwhile
+    """
+
+    def __init__(self, steps: Generator):
+        self._steps: Generator = steps
+        self._lock: threading.Lock = threading.Lock()
+
+    def step(self) -> tuple[bool, object]:
+        """
+        Run the next step
+
+        Returns:
+            (bool): solving process being finished
+            (object): result of the solving process, if finished
+        """
+
+        with self._lock:
+            try:
+                next(self._steps)
+            except StopIteration as stop:
+                return True, stop.value
+            return False, None
+
+    def close(self):
+        """
+        Stop the solving process, after the running step finished
+        """
+
+        with self._lock:
+            self._steps.close()
+
+
+async def run_steps_async(steps: Generator, executor: Executor = None):
+    """
+    Run all steps of a solving process in an executor, yielding to the event loop between steps.
+    If cancelled, the solving process is stopped after the running step
+
+    Parameters:
+        steps (Generator): steps of the solving process
+        executor (Executor): executor to run the steps in, the default one of the loop if not given
+
+    Returns:
+        result of the solving process
+    """
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    runner: StepRunner = StepRunner(steps)
+    try:
+        while True:
+            done, result = await loop.run_in_executor(executor, runner.step)
+            if done:
+                return result
+    except BaseException:
+        # the running step can not be interrupted, it is closed once finished
+        loop.run_in_executor(executor, runner.close)
+        raise
@@ -0,0 +1,67 @@
+import threading
+from typing import Union
+
+
+class SymbolTable:
+    """
+    Maps variable names to dense integer ids, which are used internally to address variables 
+    and variable pairs. Ids are never reused, so the table can be shared with snapshots
+
+    Attributes
+    ----------
+    _ids : dict[str, int]
+        maps variable names to their ids
+    _names : list[str]
+        maps ids to variable names
+    _lock : threading.Lock
+        prevents assigning the same id twice, when variables are added from multiple threads
+    """
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def intern(self, name: str) -> int:
+        """
+        Get the id of a variable, assign a new one if the variable is unknown
+
+        Parameters:
+            name (str): name of the variable
+
+        Returns:
+            (int): id of the variable
+        """
+
+        if name in self._ids:
+            return self._ids[name]
+        with self._lock:
+            if name not in self._ids:
+                self._names.append(name)
+                self._ids[name] = len(self._names) - 1
+            return self._ids[name]
+
+    def get(self, name: str) -> Union[int, None]:
+        """
+        Get the id of a variable without assigning one
+
+        Parameters:
+            name (str): name of the variable
+
+        Returns:
+            (int/None): id of the variable or none if unknown
+        """
+
+        return self._ids.get(name)
+
+    def name(self, var: int) -> str:
+        return self._names[var]
+
+    def names(self, pair: tuple[int, int]) -> tuple[str, str]:
+        return self._names[pair[0]], self._names[pair[1]]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
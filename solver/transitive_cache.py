@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+from typing import Union
+
+from statement_containers.statement import Statement
+
+
+class TransitiveCache:
+    """
+    LRU cache of transitive statements derived for variable pairs (a, c), so later hypotheses 
+    can reuse them instead of composing the whole chain again. Derived statements are valid in 
+    the model they were derived from, so an entry is only used while the model version is unchanged.
+
+    Attributes
+    ----------
+    _entries : OrderedDict[tuple[str, str], list[tuple]]
+        maps variable pairs to entries (version, x window, y window, statements), least recently 
+        used pair first
+    _size : int
+        amount of statements in the cache
+    _max_size : int
+        maximal amount of statements in the cache
+    _lock : threading.Lock
+        allows solvers and their snapshots to share the cache across threads
+    """
+
+    def __init__(self, max_size: int):
+        self._entries: OrderedDict[tuple[str, str], list[tuple]] = OrderedDict()
+        self._size: int = 0
+        self._max_size: int = max_size
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, pair: tuple[str, str], version: int, x_window: tuple[float, float],
+            y_window: tuple[float, float]) -> Union[tuple[Statement, ...], None]:
+        """
+        Search statements derived for a pair, using the same y window and an x window enveloping 
+        the given one
+
+        Parameters:
+            pair (tuple[str, str]): variable pair the statements belong to
+            version (int): version of the model
+            x_window, y_window (tuple[float, float]): area of the hypothesis
+
+        Returns:
+            (tuple[Statement]/None): derived statements or none if not cached
+        """
+
+        with self._lock:
+            if pair not in self._entries:
+                return None
+
+            for entry_version, entry_x_window, entry_y_window, statements in self._entries[pair]:
+                if entry_version == version and entry_y_window == y_window and \
+                        entry_x_window[0] <= x_window[0] and x_window[1] <= entry_x_window[1]:
+                    self._entries.move_to_end(pair)
+                    return statements
+            return None
+
+    def put(self, pair: tuple[str, str], version: int, x_window: tuple[float, float],
+            y_window: tuple[float, float], statements: tuple[Statement, ...]):
+        """
+        Save statements derived for a pair. Entries of older versions of the pair are dropped and 
+        least recently used pairs are evicted until the cache fits its size
+
+        Parameters:
+            pair (tuple[str, str]): variable pair the statements belong to
+            version (int): version of the model
+            x_window, y_window (tuple[float, float]): area of the hypothesis
+            statements (tuple[Statement]): derived statements
+        """
+
+        if len(statements) > self._max_size:
+            return
+
+        with self._lock:
+            entries: list[tuple] = []
+            for entry in self._entries.pop(pair, []):
+                if entry[0] == version:
+                    entries.append(entry)
+                else:
+                    self._size -= len(entry[3])
+            entries.append((version, x_window, y_window, statements))
+            self._entries[pair] = entries
+            self._size += len(statements)
+
+            while self._size > self._max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= sum(len(entry[3]) for entry in evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
@@ -20,23 +20,7 @@ def fetch_image_name(quality: str, color: str):
 
 
 def min_quality(quality_a: str, quality_b: str) -> str:
-    if quality_a == quality_b:
-        return quality_a
-    elif quality_a == QUALITY_CONS or quality_b == QUALITY_CONS:
-        return QUALITY_CONS
-    elif quality_a == QUALITY_ARB and quality_b != QUALITY_ARB:
-        return quality_b
-    elif quality_b == QUALITY_ARB and quality_a != QUALITY_ARB:
-        return quality_a
-    elif quality_a == QUALITY_MONO and quality_b in QUALITY_ANTI or \
-            quality_b == QUALITY_MONO and quality_a == QUALITY_ANTI:
-        return QUALITY_CONS
-    elif (quality_a == QUALITY_ANTI or quality_a == QUALITY_ANTI) and quality_b == QUALITY_CONS:
-        return quality_a
-    elif (quality_b == QUALITY_ANTI or quality_b == QUALITY_ANTI) and quality_a == QUALITY_CONS:
-        return quality_b
-    else:
-        assert False, f"Tried to minimize unknown quality pair: {quality_a}, {quality_b}"
+    return MIN[quality_a][quality_b]
 
 
 def quality_add(quality_a: str, quality_b: str) -> str:
@@ -48,13 +32,4 @@ def quality_times(quality_a: str, quality_b: str) -> str:
 
 
 def is_stronger_as(quality_a: str, quality_b: str) -> bool:
-    if quality_b == QUALITY_ARB or quality_a == QUALITY_CONS:
-        return True
-    elif quality_a == QUALITY_ARB:
-        return True if quality_b == QUALITY_ARB else False
-    elif quality_a == QUALITY_MONO:
-        return True if quality_b in [QUALITY_MONO, QUALITY_ARB] else False
-    elif quality_a == QUALITY_ANTI:
-        return True if quality_b in [QUALITY_ANTI, QUALITY_ARB] else False
-    else:
-        assert False, f"Tried to strengthen unknown quality pair: {quality_a}, {quality_b}"
+    return STRONGER[quality_a][quality_b]
@@ -0,0 +1,144 @@
+from itertools import compress
+from operator import le
+from typing import Union
+
+from statement_containers.statement import Statement
+from solver.constants import QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB, VALIDATION_STRICT, \
+    VALIDATION_SKIP, VALIDATION_REPAIR
+
+
+"""
+Checks of statements before they are added to a model. Malformed statements are handled by a policy:
+    strict - throw an exception
+    skip   - drop the malformed statements
+    repair - swap inverted bounds, weaken unknown qualities to arbitrary and drop the remaining
+             malformed (NaN) statements
+"""
+
+
+QUALITIES: frozenset = frozenset({QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB})
+POLICIES: frozenset = frozenset({VALIDATION_STRICT, VALIDATION_SKIP, VALIDATION_REPAIR})
+
+
+def check_statement(begin: float, end: float, quality: str, begin_y: float, end_y: float) -> Union[str, None]:
+    """
+    Check a single statement
+
+    Returns:
+        (str/None): reason why the statement is malformed, or none if it is well-formed
+    """
+
+    # comparisons with NaN are always false
+    if begin != begin or end != end or begin_y != begin_y or end_y != end_y:
+        return "NaN bound"
+    if not (begin <= end and begin_y <= end_y):
+        return "interval with begin > end"
+    if quality not in QUALITIES:
+        return f"unknown quality '{quality}'"
+    return None
+
+
+def validate_statement(statement: Statement, policy: str = VALIDATION_STRICT) -> Union[Statement, None]:
+    """
+    Check a single statement
+
+    Parameters:
+        statement (Statement): statement to check
+        policy (str): handling of a malformed statement, strict throws an exception
+
+    Returns:
+        (Statement/None): the (repaired) statement, or none if it is skipped
+    """
+
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown validation policy: {policy}")
+    reason: Union[str, None] = check_statement(*statement)
+    if reason is None:
+        return statement
+    if policy == VALIDATION_STRICT:
+        raise ValueError(f"Statement {statement} is malformed: {reason}")
+    if policy == VALIDATION_REPAIR:
+        begin, end, quality, begin_y, end_y = statement
+        statement = Statement(*(end, begin) if begin > end else (begin, end),
+                              quality if quality in QUALITIES else QUALITY_ARB,
+                              *(end_y, begin_y) if begin_y > end_y else (begin_y, end_y))
+        if check_statement(*statement) is None:
+            return statement
+    return None
+
+
+def validate_columns(begin, end, quality, begin_y, end_y, policy: str = VALIDATION_STRICT) -> Union[list[bool], None]:
+    """
+    Check columns of statements. Each check runs over a whole column at once, only if one fails
+    the malformed statements are searched
+
+    Parameters:
+        begin, end (sequence[float]): range intervals of the statements
+        quality (sequence[str]): qualities of the statements
+        begin_y, end_y (sequence[float]): domain intervals of the statements
+        policy (str): handling of malformed statements, strict throws an exception
+
+    Returns:
+        (list[bool]/None): statements to keep, or none if all statements are well-formed
+    """
+
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown validation policy: {policy}")
+    if not len(begin) == len(end) == len(quality) == len(begin_y) == len(end_y):
+        raise ValueError("Columns of the statements differ in length")
+
+    # NaN bounds fail the comparisons as well
+    if all(map(le, begin, end)) and all(map(le, begin_y, end_y)) and QUALITIES.issuperset(quality):
+        return None
+
+    keep: list[bool] = [check_statement(*statement) is None for statement in zip(begin, end, quality, begin_y, end_y)]
+    if policy == VALIDATION_STRICT:
+        i: int = keep.index(False)
+        statement: tuple = (begin[i], end[i], quality[i], begin_y[i], end_y[i])
+        raise ValueError(f"Statement {i} {statement} is malformed: {check_statement(*statement)}")
+    return keep
+
+
+def repair_columns(begin, end, quality, begin_y, end_y) -> tuple[list, list, list, list, list]:
+    """
+    Repair columns of statements, by swapping inverted bounds and weakening unknown qualities to
+    arbitrary. NaN bounds can not be repaired
+
+    Parameters:
+        begin, end (sequence[float]): range intervals of the statements
+        quality (sequence[str]): qualities of the statements
+        begin_y, end_y (sequence[float]): domain intervals of the statements
+
+    Returns:
+        (tuple[list, list, list, list, list]): repaired columns
+    """
+
+    begin, end = _repair_bounds(begin, end)
+    begin_y, end_y = _repair_bounds(begin_y, end_y)
+    if not QUALITIES.issuperset(quality):
+        quality = [q if q in QUALITIES else QUALITY_ARB for q in quality]
+    return begin, end, quality, begin_y, end_y
+
+
+def filter_columns(keep: list[bool], *columns) -> list[list]:
+    """
+    Drop the entries of columns, that are not kept
+
+    Parameters:
+        keep (list[bool]): entries to keep
+        columns (sequence): columns to filter
+
+    Returns:
+        (list[list]): filtered columns
+    """
+
+    return [list(compress(column, keep)) for column in columns]
+
+
+def _repair_bounds(begin, end) -> tuple:
+    if all(map(le, begin, end)):
+        return begin, end
+    # NaN bounds are kept as they are, since the comparison is false
+    inverted: list[bool] = [b > e for b, e in zip(begin, end)]
+    return ([e if swap else b for b, e, swap in zip(begin, end, inverted)],
+            [b if swap else e for b, e, swap in zip(begin, end, inverted)])
@@ -0,0 +1,92 @@
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+from statement_containers.statement import Statement
+
+
+class DomainIndex:
+    """
+    Index of the statements of a variable pair on their domain interval (y-axis). Statements are sorted
+    by the begin of their domain, augmented with the maximal end of the domains as implicit binary tree.
+    Used to find the statements overlapping a domain interval in time proportional to their amount.
+    The index is not changed after building, so it can be shared with snapshots
+
+    Attributes
+    ----------
+    _statements : list[Statement]
+        statements sorted by the begin of their domain
+    _begins_y : list[float]
+        begins of the domains of the sorted statements
+    _ends_y : list[float]
+        sorted ends of the domains, used to count overlapping statements
+    _max_end_y : list[float]
+        maximal end of the domains of the subtrees, the leaves (statements) start at index _size
+    _size : int
+        amount of leaves of the tree, a power of two
+    """
+
+    def __init__(self, statements: set[Statement]):
+        """
+        Sort the statements and build the tree
+
+        Parameters:
+            statements (set[Statement]): statements of the variable pair
+        """
+
+        self._statements: list[Statement] = sorted(statements, key=attrgetter('begin_y'))
+        self._begins_y: list[float] = [st.begin_y for st in self._statements]
+        self._ends_y: list[float] = sorted(st.end_y for st in self._statements)
+
+        self._size: int = 1
+        while self._size < len(self._statements):
+            self._size *= 2
+        self._max_end_y: list[float] = [float('-inf')] * (2 * self._size)
+        self._max_end_y[self._size:self._size + len(self._statements)] = [st.end_y for st in self._statements]
+        for node in range(self._size - 1, 0, -1):
+            self._max_end_y[node] = max(self._max_end_y[2 * node], self._max_end_y[2 * node + 1])
+
+    def overlapping(self, begin_y: float, end_y: float) -> set[Statement]:
+        """
+        Find the statements overlapping a domain interval. Only statements beginning before end_y are
+        searched, skipping subtrees ending before begin_y
+
+        Parameters:
+            begin_y (float): begin of the domain interval
+            end_y (float): end of the domain interval
+
+        Returns:
+            (set[Statement]): overlapping statements
+        """
+
+        limit: int = bisect_right(self._begins_y, end_y)
+        result: set[Statement] = set()
+        stack: list[tuple[int, int, int]] = [(1, 0, self._size)] if limit > 0 else []
+        while stack:
+            node, lower, upper = stack.pop()
+            if lower >= limit or self._max_end_y[node] < begin_y:
+                continue
+            if node >= self._size:
+                result.add(self._statements[lower])
+                continue
+            middle: int = (lower + upper) // 2
+            stack.append((2 * node + 1, middle, upper))
+            stack.append((2 * node, lower, middle))
+        return result
+
+    def count(self, begin_y: float, end_y: float) -> int:
+        """
+        Count the statements overlapping a domain interval, without collecting them. A statement ending
+        before begin_y also begins before end_y, so it is subtracted from the ones beginning before end_y
+
+        Parameters:
+            begin_y (float): begin of the domain interval
+            end_y (float): end of the domain interval
+
+        Returns:
+            (int): amount of overlapping statements
+        """
+
+        return max(bisect_right(self._begins_y, end_y) - bisect_left(self._ends_y, begin_y), 0)
+
+    def __len__(self):
+        return len(self._statements)
@@ -1,5 +1,7 @@
+import bisect
 from typing import Union
 
+import solver.backend as backend
 import solver.rules as rules
 import statement_containers.util as util
 from statement_containers.statement import Statement
@@ -23,14 +25,27 @@ class OverlapMap:
         all boundaries in the model
     _initiated : bool
         indicates that the building of the container is done and the normalized ones are extracted
+    _by_begin : list[Statement]
+        added statements sorted by their begin, used to find dominating/dominated statements
+    _begins : list[float]
+        begins of the statements in _by_begin, used for bisection
+    _max_width : float
+        width of the widest added statement, bounds the area to search for dominating statements
+    _index : tuple
+        begins, ends, gap prefix sums and sparse tables (begin_y, end_y, quality) of the normalized
+        statements, used to join overlapping statements without scanning them. Built on demand
     """
 
 
     def __init__(self, statements=None):
         self._statements: set[Statement] = statements if statements is not None else set()
+        self._by_begin: list[Statement] = sorted(self._statements, key=lambda st: st.begin)
+        self._begins: list[float] = [st.begin for st in self._by_begin]
+        self._max_width: float = max((st.end - st.begin for st in self._by_begin), default=0)
         self._normalized: list[Statement] = []
         self._overlap_map: dict[float, set[Statement]] = {}
         self._boundaries: list[float] = []
+        self._index: Union[tuple, None] = None
 
         self._initiated: bool = False
         if statements is not None:
@@ -45,7 +60,7 @@ class OverlapMap:
         if self._initiated:
             return
 
-        self._boundaries: list[float] = util.init_boundaries(self._statements, self._overlap_map)
+        self._boundaries: list[float] = backend.init_boundaries(self._statements, self._overlap_map)
         for i in range(len(self._boundaries) - 1):
             point: float = self._boundaries[i]
             if not self._overlap_map[point]:
@@ -54,48 +69,123 @@ class OverlapMap:
             next_point: float = self._boundaries[i + 1]
             statement: Statement = rules.interval_strength_multiple(point, next_point, self._overlap_map[point])
             self._normalized.append(statement)
+            self._index = None
 
     def add(self, statement: Statement):
         """
-        Add a statement to the container
+        Add a statement to the container. The statement is dropped, if an added statement is stronger, 
+        and added statements it is stronger as are removed
 
         Parameters:
             statement (Statement): statement to add
+
+        Returns:
+            (bool): indicating if the statement was added
         """
 
         if statement is None:
             return False
+
+        # a stronger statement envelops the new one, so it begins in [end - max_width, begin]
+        lower: int = bisect.bisect_left(self._begins, statement.end - self._max_width)
+        upper: int = bisect.bisect_right(self._begins, statement.begin)
+        for i in range(lower, upper):
+            if self._by_begin[i].stronger_as(statement):
+                return False
+
+        # a weaker statement is enveloped by the new one, so it begins in [begin, end]
+        lower = bisect.bisect_left(self._begins, statement.begin)
+        upper = bisect.bisect_right(self._begins, statement.end)
+        kept: list[Statement] = []
+        for st in self._by_begin[lower:upper]:
+            if statement.stronger_as(st):
+                self._statements.discard(st)
+            else:
+                kept.append(st)
+        if len(kept) < upper - lower:
+            self._by_begin[lower:upper] = kept
+            self._begins[lower:upper] = [st.begin for st in kept]
+
+        index: int = bisect.bisect_right(self._begins, statement.begin)
+        self._by_begin.insert(index, statement)
+        self._begins.insert(index, statement.begin)
+        self._max_width = max(self._max_width, statement.end - statement.begin)
         self._statements.add(statement)
         return True
 
-    def _overlap(self, begin: float, end: float) -> list[Statement]:
+    def slimest_statement(self, begin: float, end: float) -> Union[Statement, None]:
         """
-        Check which statements overlap a given area
+        Build the slimest statement envelopping a given area, by joining overlapping ones together
 
-        Parameters: 
+        Parameters:
             begin, end (float): [begin, end] interval to check overlap for 
+        
+        Returns:
+            (Statement/None): slimest statement enveloping the given area
         """
 
-        start, end = util.overlapping(self._normalized, begin, end)
-        if start == end == -1:
-            return []
-        return self._normalized[start:end]
+        if not self._normalized:
+            return None
+        if begin > end:
+            return self._slimest_inverted(begin, end)
+        return util.join_overlapping(self._get_index(), begin, end)
 
-    def slimest_statement(self, begin: float, end: float) -> Union[Statement, None]:
+    def slimest_statements(self, intervals: list[tuple[float, float]]) -> list[Union[Statement, None]]:
         """
-        Build the slimest statement envelopping a given area, by joining overlapping ones together
+        Build the slimest statements envelopping multiple areas at once. The areas are sorted by their
+        begin and end, so the overlapping statements of all areas are found in a single sweep over the
+        normalized statements
 
         Parameters:
-            begin, end (float): [begin, end] interval to check overlap for 
-        
+            intervals (list[tuple[float, float]]): [begin, end] intervals to check overlap for
+
         Returns:
-            (Statement): slimest statement enveloping the given area
+            (list[Statement/None]): slimest statement enveloping each area, in the order of the areas
         """
-        
-        statement: list[Statement] = self._overlap(begin, end)
-        if not statement:
+
+        if not self._normalized:
+            return [None] * len(intervals)
+        begins, ends = self._get_index()[:2]
+
+        # first statement ending after the begin of the area, ends are sorted as well
+        lower: list[int] = [0] * len(intervals)
+        i: int = 0
+        for pos in sorted(range(len(intervals)), key=lambda k: intervals[k][0]):
+            while i < len(ends) and ends[i] < intervals[pos][0]:
+                i += 1
+            lower[pos] = i
+
+        # last statement beginning before the end of the area
+        upper: list[int] = [0] * len(intervals)
+        i = 0
+        for pos in sorted(range(len(intervals)), key=lambda k: intervals[k][1]):
+            while i < len(begins) and begins[i] <= intervals[pos][1]:
+                i += 1
+            upper[pos] = i - 1
+
+        return [util.join_range(self._index, lower[pos], upper[pos]) if begin <= end
+                else self._slimest_inverted(begin, end) for pos, (begin, end) in enumerate(intervals)]
+
+    def _slimest_inverted(self, begin: float, end: float) -> Union[Statement, None]:
+        """
+        Build the slimest statement for an inverted area (begin > end), which the interval strength rule 
+        produces for empty intersections. The overlapping statements are searched by util.overlapping, 
+        like for any area before the index was used, so such areas are handled as before
+        """
+
+        start, stop = util.overlapping(self._normalized, begin, end)
+        if start == stop == -1:
             return None
-        return rules.interval_join_multiple(statement)
+        return rules.interval_join_multiple(self._normalized[start:stop])
+
+    def _get_index(self) -> tuple:
+        """
+        Build (if needed) the index over the normalized statements, see util.build_join_index
+        """
+
+        if self._index is None:
+            self._index = util.build_join_index(self._normalized)
+        return self._index
 
     def get_statements(self) -> list[Statement]:
         return self._normalized
@@ -1,11 +1,12 @@
 from collections import namedtuple
 
-from solver.util import is_stronger_as
+from solver.constants import STRONGER, QUALITY_RANK
 
 
 class Statement(namedtuple('IntervalBase', ['begin', 'end', 'quality', 'begin_y', 'end_y'])):
     """
-    Internal representation of statements
+    Internal representation of statements. Equality and hashing are the ones of tuple, statements 
+    are ordered by their begin and the rank of their quality (see sort_key)
 
     namedtuple
     ----------
@@ -22,11 +23,8 @@ class Statement(namedtuple('IntervalBase', ['begin', 'end', 'quality', 'begin_y'
     """
     __slots__ = ()
 
-    def __new__(cls, begin, end, quality, begin_y, end_y):
-        return super(Statement, cls).__new__(cls, begin, end, quality, begin_y, end_y)
-
     def stronger_as(self, iv, height=None):
-        return is_stronger_as(self.quality, iv.quality) and self.begin <= iv.begin and self.end >= iv.end and \
+        return STRONGER[self.quality][iv.quality] and self.begin <= iv.begin and self.end >= iv.end and \
                ((self.begin_y >= iv.begin_y and self.end_y <= iv.end_y) or
                 (height is not None and height[0] <= self.begin_y and height[1] >= self.end_y))
 
@@ -62,30 +60,18 @@ class Statement(namedtuple('IntervalBase', ['begin', 'end', 'quality', 'begin_y'
     def contains_point(self, p: float) -> bool:
         return self.begin <= p <= self.end
 
-    def __eq__(self, other):
-        return (
-                self.begin == other.begin and
-                self.end == other.end and
-                self.quality == other.quality and
-                self.begin_y == other.begin_y and
-                self.end_y == other.end_y
-        )
-
-    def __hash__(self):
-        return hash((self.begin, self.end, self.quality, self.begin_y, self.end_y))
-
-    def __cmp__(self, other):
-        if self.begin != other.begin:
-            return -1 if self.begin < other.begin else 1
-        if self.quality == other.quality:
-            return 0
-        return 1 if is_stronger_as(self.quality, other.quality) else -1
+    def sort_key(self) -> tuple[float, int]:
+        return self[0], QUALITY_RANK[self[2]]
 
     def __lt__(self, other):
-        return self.__cmp__(other) < 0
+        if self[0] != other[0]:
+            return self[0] < other[0]
+        return QUALITY_RANK[self[2]] < QUALITY_RANK[other[2]]
 
     def __gt__(self, other):
-        return self.__cmp__(other) > 0
+        if self[0] != other[0]:
+            return self[0] > other[0]
+        return QUALITY_RANK[self[2]] > QUALITY_RANK[other[2]]
 
     def __repr__(self):
         return f"Interval({self.begin}, {self.end}, {self.quality}, {self.begin_y}, {self.end_y})"
@@ -1,11 +1,13 @@
 import time
 from typing import Union
 
+import solver.backend as backend
 import solver.rules as rules
 import statement_containers.util as util
 from solver.constants import QUALITY_MONO, SEARCH_LEFT, SEARCH_RIGHT, QUALITY_ANTI, QUALITY_CONS, CORRECT_LOWER, \
     CORRECT_UPPER
 from statement_containers.statement import Statement
+from statement_containers.sweep_index import SweepIndex
 
 
 class StatementListDynamic:
@@ -19,18 +21,20 @@ class StatementListDynamic:
 
     Attributes
     ----------
-    instance : StatementListDynamic
-        (only) instance of this class
     statements : set[Statement]
         container of the added statements
     hypothesis : tuple
         hypothesis to check
     _normalized : list[Statement]
         container of statements after normalization process
-    _overlap_map : dict[float, set[Statement]]
-        maps boundaries to overlapping statements
-    _boundaries : list[float]
-        all boundaries in the model
+    _visualized : bool
+        the joined statement proving the hypothesis being appended to the normalized statements
+    _index : SweepIndex
+        index of the statements on the range interval, used to sweep the boundaries from the hypothesis
+    _shared_index : bool
+        the index (and the statements) being the ones of the variable pair, of which only the statements 
+        overlapping the domain of the hypothesis are normalized. They are not changed, but replaced once 
+        statements are added
     x_min : float
         minimum x value to consider for solving
     x_max : float
@@ -38,22 +42,24 @@ class StatementListDynamic:
     _ov_min : int
         index of lowest (in order) statement overlapping the hypothesis
     _ov_max: int
-        index of highest (in order) statement overlapping the hypothesis
+        index after the highest (in order) statement overlapping the hypothesis
     """
 
-    instance = None
-
-    @staticmethod
-    def get_instance():
-        return StatementListDynamic.instance
+    def __init__(self, hypothesis: tuple, statements: set[Statement], index: SweepIndex = None):
+        """
+        Parameters:
+            hypothesis (tuple): hypothesis to check
+            statements (set[Statement]): statements of the model, or of the variable pair if the index is given
+            index (SweepIndex): index of the statements of the variable pair, only the ones overlapping the 
+                domain of the hypothesis are used. Built from the statements if not given
+        """
 
-    def __init__(self, hypothesis: tuple, statements: set[Statement]):
-        StatementListDynamic.instance = self
         self.hypothesis: tuple = hypothesis
         self.statements: set[Statement] = statements
         self._normalized: list[Statement] = []
-        self._overlap_map: dict[float, set[Statement]] = {}
-        self._boundaries: list[float] = []
+        self._visualized: bool = False
+        self._shared_index: bool = index is not None
+        self._index: SweepIndex = index if index is not None else SweepIndex(statements)
 
         self.x_min: float = float("-inf")
         self.x_max: float = float("inf")
@@ -65,13 +71,10 @@ class StatementListDynamic:
         Reset the normilaization
         """
 
-        self._overlap_map = {}
-        self._boundaries = []
         self._normalized = []
-        tmp_sts: set[Statement] = self.statements.copy()
-        self.statements = set()
-        for st in tmp_sts:
-            self.add(st)
+        self._visualized = False
+        self._index = SweepIndex(self.statements)
+        self._shared_index = False
 
     def solve(self) -> tuple[bool, float]:
         """
@@ -87,8 +90,7 @@ class StatementListDynamic:
         if not self.statements:
             return False, time.time() - start_time
 
-        self._overlap_map.clear()
-        self._boundaries = util.init_boundaries(self.statements, self._overlap_map)
+        # the statements are normalized lazily, only the segments needed are built
         self.statements = set()
 
         self.build_necessary_statements()
@@ -97,38 +99,46 @@ class StatementListDynamic:
     def build_necessary_statements(self):
         """
         Check statements overlapping hypethesis and search as many statements needed to possibly decrease their height 
-        as low as needed (envoloped by hypothesis)
+        as low as needed (envoloped by hypothesis). The normalized statements are built on demand, sweeping from 
+        the last boundary before the hypothesis to the right and, if needed, to the left
         """
 
         lower, upper = self.hypothesis[1]
         lower_y, upper_y = self.hypothesis[3]
 
-        if len(self._boundaries) > 0 and self._boundaries[0] > lower or self._boundaries[-1] < upper:
-            pass
-
-        begin, end = util.get_overlap_index(self._boundaries, lower, upper)
+        # the last boundary before the hypothesis, or the first boundary of the model
+        start: Union[float, None] = self._previous_boundary(lower)
+        if start is None:
+            start = self._next_boundary(float("-inf"), inclusive=True)
+        if start is None:
+            return
         exceeding_height: list[Statement] = []
 
-        # build overlapping first
-        if end > len(self._boundaries):
-            end = len(self._boundaries)
+        # statements overlapping the first boundary, the sides are swept from there
+        overlapping_left: set[Statement] = {st for st in self._index.overlapping(start) if self._normalizes(st)}
+        overlapping_right: set[Statement] = overlapping_left
 
         # build area overlapping the hypothesis
         self._ov_min = 0
-        self._ov_max = end
-        for i in range(begin, end):
-            point: float = self._boundaries[i]
-            if not self._overlap_map[point]:
-                continue
+        self._ov_max = 0
+        point: Union[float, None] = start
+        while point is not None and point <= upper:
+            if point != start:
+                overlapping_right = util.sweep_right(overlapping_right, self._starting(point), self._ending(point))
+            next_point: Union[float, None] = self._next_boundary(point)
+            if overlapping_right:
+                if next_point is None:
+                    break
 
-            next_point: float = self._boundaries[i + 1]
-            st: Statement = rules.interval_strength_multiple(point, next_point, self._overlap_map[point])
+                st: Statement = rules.interval_strength_multiple(point, next_point, overlapping_right)
 
-            if st.exceeds_height(lower_y, upper_y):
-                exceeding_height.append(st)
+                if st.exceeds_height(lower_y, upper_y):
+                    exceeding_height.append(st)
 
-            self._normalized.append(st)
-            self.statements.add(st)
+                self._normalized.append(st)
+                self.statements.add(st)
+                self._ov_max += 1
+            point = next_point
 
         if len(exceeding_height) == 0:
             # try to solve
@@ -142,55 +152,98 @@ class StatementListDynamic:
 
         # add left statements
         if exceeding_height[0] == self._normalized[0] and search_left:
-            for i in range(begin - 1, -1, -1):
-                point: float = self._boundaries[i]
-                if not self._overlap_map[point]:
-                    continue
+            next_point: float = start
+            left_point: Union[float, None] = self._previous_boundary(start)
+            while left_point is not None:
+                overlapping_left = util.sweep_left(overlapping_left, self._starting(next_point),
+                                                   self._ending(next_point))
+                if overlapping_left:
+                    if next_point < self.x_min:
+                        break
+
+                    st: Statement = rules.interval_strength_multiple(left_point, next_point, overlapping_left)
+                    self._normalized.insert(0, st)
+                    self.statements.add(st)
+
+                    # correct area overlapping the hypothesis
+                    self._ov_min += 1
+                    self._ov_max += 1
+
+                    # check bounds correction
+                    if CORRECT_UPPER in correct_bounds_left and st.end_y <= upper_y:
+                        correct_bounds_left.remove(CORRECT_UPPER)
+                    if CORRECT_LOWER in correct_bounds_left and st.begin_y >= lower_y:
+                        correct_bounds_left.remove(CORRECT_LOWER)
+                    if not correct_bounds_left:
+                        self.x_min = st.end
+                next_point, left_point = left_point, self._previous_boundary(left_point)
+
+        # add right statements, starting at the first boundary after the hypothesis
+        if exceeding_height[-1] == self._normalized[-1] and search_right and point is not None:
+            next_point = self._next_boundary(point)
+            while next_point is not None:
+                overlapping_right = util.sweep_right(overlapping_right, self._starting(point), self._ending(point))
+                if overlapping_right:
+                    if point > self.x_max:
+                        break
+
+                    st: Statement = rules.interval_strength_multiple(point, next_point, overlapping_right)
+                    self._normalized.append(st)
+                    self.statements.add(st)
+
+                    # check bounds correction
+                    if CORRECT_UPPER in correct_bounds_right and st.end_y <= upper_y:
+                        correct_bounds_right.remove(CORRECT_UPPER)
+                    if CORRECT_LOWER in correct_bounds_right and st.begin_y >= lower_y:
+                        correct_bounds_right.remove(CORRECT_LOWER)
+                    if not correct_bounds_right:
+                        self.x_max = st.begin
+                point, next_point = next_point, self._next_boundary(next_point)
 
-                next_point: float = self._boundaries[i + 1]
-                if next_point < self.x_min:
-                    break
+        self.strengthen_interval_height_sides()
 
-                st: Statement = rules.interval_strength_multiple(point, next_point, self._overlap_map[point])
-                self._normalized.insert(0, st)
-                self.statements.add(st)
+    def _starting(self, point: float) -> list[Statement]:
+        """
+        Get the statements to normalize beginning at a boundary
+        """
 
-                # correct area overlapping the hypothesis
-                self._ov_min += 1
-                self._ov_max += 1
+        return [st for st in self._index.starting(point) if self._normalizes(st)]
 
-                # check bounds correction
-                if CORRECT_UPPER in correct_bounds_left and st.end_y <= upper_y:
-                    correct_bounds_left.remove(CORRECT_UPPER)
-                if CORRECT_LOWER in correct_bounds_left and st.begin_y >= lower_y:
-                    correct_bounds_left.remove(CORRECT_LOWER)
-                if not correct_bounds_left:
-                    self.x_min = st.end
-
-        # add right statements
-        if exceeding_height[-1] == self._normalized[-1] and search_right:
-            for i in range(end, len(self._boundaries) - 1):
-                point: float = self._boundaries[i]
-                if not self._overlap_map[point]:
-                    continue
-
-                next_point: float = self._boundaries[i + 1]
-                if point > self.x_max:
-                    break
+    def _ending(self, point: float) -> list[Statement]:
+        """
+        Get the statements to normalize (with width) ending at a boundary
+        """
 
-                st: Statement = rules.interval_strength_multiple(point, next_point, self._overlap_map[point])
-                self._normalized.append(st)
-                self.statements.add(st)
+        return [st for st in self._index.ending(point) if self._normalizes(st)]
 
-                # check bounds correction
-                if CORRECT_UPPER in correct_bounds_right and st.end_y <= upper_y:
-                    correct_bounds_right.remove(CORRECT_UPPER)
-                if CORRECT_LOWER in correct_bounds_right and st.begin_y >= lower_y:
-                    correct_bounds_right.remove(CORRECT_LOWER)
-                if not correct_bounds_right:
-                    self.x_max = st.begin
+    def _normalizes(self, statement: Statement) -> bool:
+        """
+        Check if a statement of the index is normalized, i.e. overlaps the domain of the hypothesis if the 
+        index is the one of the variable pair
+        """
 
-        self.strengthen_interval_height_sides()
+        return not self._shared_index or statement.overlaps_y(*self.hypothesis[3])
+
+    def _next_boundary(self, point: float, inclusive: bool = False) -> Union[float, None]:
+        """
+        Get the first boundary of the statements to normalize after a point, skipping boundaries of
+        statements of the index which are not normalized
+        """
+
+        point = self._index.next_boundary(point, inclusive)
+        while point is not None and not self._starting(point) and not self._ending(point):
+            point = self._index.next_boundary(point)
+        return point
+
+    def _previous_boundary(self, point: float) -> Union[float, None]:
+        """
+        Get the last boundary of the statements to normalize before a point, see '_next_boundary'
+        """
+
+        point = self._index.previous_boundary(point)
+        while point is not None and not self._starting(point) and not self._ending(point):
+            point = self._index.previous_boundary(point)
+        return point
 
     def check_slimest_envelopping(self) -> bool:
         """
@@ -201,16 +254,25 @@ class StatementListDynamic:
             (bool): result of the fact rule
         """
 
-        if self._ov_max == -1 or self._ov_min == -1:
-            return False
-        overlapping: list[Statement] = self._normalized[self._ov_min:self._ov_max]
-        statement: Union[Statement, None] = rules.interval_join_multiple(overlapping)
-
+        statement: Union[Statement, None] = self.slimest_envelopping()
         result: bool = rules.rule_fact(self.hypothesis, statement)
         if result:
             self._normalized.append(statement)  # This destroys the order of the list, is for visualizing only
+            self._visualized = True
         return result
 
+    def slimest_envelopping(self) -> Union[Statement, None]:
+        """
+        Join the normalized statements overlapping the hypothesis
+
+        Returns:
+            (Statement/None): joined statement, or none if no statement overlaps or they have a gap
+        """
+
+        if self._ov_max == -1 or self._ov_min == -1:
+            return None
+        return backend.interval_join_multiple(self._normalized[self._ov_min:self._ov_max])
+
     def add(self, statement: Statement) -> bool:
         """
         Add a statement to the model
@@ -222,10 +284,19 @@ class StatementListDynamic:
             (bool): indicating if adding was a success
         """
 
-        if statement is None or statement in self.statements:
+        if statement is None:
+            return False
+
+        # the statements and the index of the variable pair are not changed, own ones are built instead
+        if self._shared_index:
+            self.statements = {st for st in self.statements if self._normalizes(st)}
+            self._index = SweepIndex(self.statements)
+            self._shared_index = False
+        if statement in self.statements:
             return False
 
         self.statements.add(statement)
+        self._index.add(statement)
         return True
 
     def get_statements_by_index(self, begin, end=None):
@@ -241,11 +312,21 @@ class StatementListDynamic:
         return self._normalized[begin:end]
 
     def strengthen_interval_height_sides(self):
-        util.strengthen_interval_height_sides(self._normalized)
+        backend.strengthen_interval_height_sides(self._normalized)
 
     def get_statements(self):
         return self._normalized
 
+    def get_segments(self) -> list[Statement]:
+        """
+        Get the normalized statements in order, without the joined statement appended for visualizing
+
+        Returns:
+            (list[Statement]): sorted normalized statements
+        """
+
+        return self._normalized[:-1] if self._visualized else self._normalized
+
     def __len__(self) -> int:
         return len(self._normalized)
 
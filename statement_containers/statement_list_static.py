@@ -1,3 +1,6 @@
+from typing import Union
+
+import solver.backend as backend
 import solver.rules as rules
 import statement_containers.util as util
 from solver.constants import CORRECT_UPPER, CORRECT_LOWER
@@ -18,12 +21,16 @@ class IntervalListStatic:
         maps boundaries to overlapping statements
     _boundaries : list[float]
         all boundaries in the model
+    _index : tuple
+        join index (hierarchy of coarsened models) over the normalized statements, see 
+        util.build_join_index. Built on demand
     """
 
     def __init__(self, ivs):
         self._normalized: list[Statement] = []
         self._overlap_map: dict[float, set[Statement]] = {}
-        self._boundaries: list[float] = util.init_boundaries(ivs, self._overlap_map)
+        self._boundaries: list[float] = backend.init_boundaries(ivs, self._overlap_map)
+        self._index: Union[tuple, None] = None
 
         # init model
         for i in range(len(self._boundaries) - 1):
@@ -50,9 +57,9 @@ class IntervalListStatic:
         return self._normalized[begin:end]
 
     def strengthen_interval_height_sides(self):
-        util.strengthen_interval_height_sides(self._normalized)
+        backend.strengthen_interval_height_sides(self._normalized)
 
-    def interval_height_and_transitives(self, solver, model, a: str, c: str):
+    def interval_height_and_transitives(self, solver, model, a: int, c: int):
         """
         Lower the height of the statements in the area relevant for the hypothesis and 
         try to only build the relevant one (in the same manner as in statement_list_dynamic)
@@ -60,10 +67,10 @@ class IntervalListStatic:
         Parameters:
             solver (Solver): solver object
             model: model containing statements to use transitivity rule with
-            a, c (str): transitive influence
+            a, c (int): transitive influence
         """
         
-        instance: StatementListDynamic = StatementListDynamic.get_instance()
+        instance: StatementListDynamic = solver.get_hypothesis_model()
         lower, upper = instance.hypothesis[1]
         lower_y, upper_y = instance.hypothesis[3]
         begin, end = util.overlapping(self._normalized, lower, upper)  
@@ -76,10 +83,7 @@ class IntervalListStatic:
         # build overlapping first
         if end > len(self._normalized):
             end = len(self._normalized)
-        for i in range(begin, end):
-            st: Statement = self._normalized[i]
-            new_st: Statement = solver.create_transitive_from_statement(st, model, a, c)
-
+        for new_st in solver.create_transitives_from_statements(self._normalized[begin:end], model, a, c):
             # check if correction is needed
             if new_st is not None and new_st.contains_point(lower):
                 if new_st.begin_y < lower_y:
@@ -121,13 +125,37 @@ class IntervalListStatic:
                 # check if bound is corrected
                 if new_st is not None:
                     if CORRECT_LOWER in correct_right and new_st.begin_y >= lower_y:
-                        correct_left.remove(CORRECT_LOWER)
+                        correct_right.remove(CORRECT_LOWER)
                     if CORRECT_UPPER in correct_right and new_st.end_y <= upper_y:
                         correct_right.remove(CORRECT_UPPER)
                     if not correct_right:
                         instance.x_max = st.begin
                         break
 
+    def build_index(self) -> tuple:
+        """
+        Build (if needed) the join index over the normalized statements, see util.build_join_index
+        """
+
+        if self._index is None:
+            self._index = util.build_join_index(self._normalized)
+        return self._index
+
+    def slimest_statement(self, begin: float, end: float) -> Union[Statement, None]:
+        """
+        Build the slimest statement envelopping a given area, by joining the overlapping normalized statements
+
+        Parameters:
+            begin, end (float): [begin, end] interval to check overlap for
+
+        Returns:
+            (Statement/None): slimest statement enveloping the given area, or none if there is a gap
+        """
+
+        if not self._normalized:
+            return None
+        return util.join_overlapping(self.build_index(), begin, end)
+
     def get_statements(self) -> list[Statement]:
         return self._normalized
 
@@ -0,0 +1,147 @@
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Union
+
+from statement_containers.statement import Statement
+
+
+class SweepIndex:
+    """
+    Index of statements on their range interval (x-axis). Statements are sorted by their begin and
+    (if they have a width) by their end, so the boundaries of the model can be swept from any point
+    by bisection, without sorting all boundaries first. The boundaries are the begins and the ends of
+    the statements with width, like in util.init_boundaries
+
+    Attributes
+    ----------
+    _by_begin : list[Statement]
+        statements sorted by their begin
+    _begins : list[float]
+        begins of the statements in _by_begin, used for bisection
+    _by_end : list[Statement]
+        statements with width sorted by their end
+    _ends : list[float]
+        ends of the statements in _by_end, used for bisection
+    _points : list[Statement]
+        statements without width sorted by their begin, they overlap all later boundaries
+    _point_begins : list[float]
+        begins of the statements in _points, used for bisection
+    _max_width : float
+        width of the widest statement, bounds the area to search for statements overlapping a boundary
+    """
+
+    def __init__(self, statements):
+        """
+        Sort the statements
+
+        Parameters:
+            statements (iterable[Statement]): statements to index
+        """
+
+        self._by_begin: list[Statement] = sorted(statements, key=attrgetter('begin'))
+        self._begins: list[float] = [st.begin for st in self._by_begin]
+        self._by_end: list[Statement] = sorted((st for st in self._by_begin if st.begin != st.end),
+                                               key=attrgetter('end'))
+        self._ends: list[float] = [st.end for st in self._by_end]
+        self._points: list[Statement] = [st for st in self._by_begin if st.begin == st.end]
+        self._point_begins: list[float] = [st.begin for st in self._points]
+        self._max_width: float = max((st.end - st.begin for st in self._by_begin), default=0)
+
+    def add(self, statement: Statement):
+        """
+        Add a statement to the index
+
+        Parameters:
+            statement (Statement): statement to add
+        """
+
+        index: int = bisect_right(self._begins, statement.begin)
+        self._by_begin.insert(index, statement)
+        self._begins.insert(index, statement.begin)
+        if statement.begin == statement.end:
+            index = bisect_right(self._point_begins, statement.begin)
+            self._points.insert(index, statement)
+            self._point_begins.insert(index, statement.begin)
+            return
+
+        index = bisect_right(self._ends, statement.end)
+        self._by_end.insert(index, statement)
+        self._ends.insert(index, statement.end)
+        self._max_width = max(self._max_width, statement.end - statement.begin)
+
+    def starting(self, point: float) -> list[Statement]:
+        """
+        Get the statements beginning at a boundary
+        """
+
+        return self._by_begin[bisect_left(self._begins, point):bisect_right(self._begins, point)]
+
+    def ending(self, point: float) -> list[Statement]:
+        """
+        Get the statements with width ending at a boundary
+        """
+
+        return self._by_end[bisect_left(self._ends, point):bisect_right(self._ends, point)]
+
+    def next_boundary(self, point: float, inclusive: bool = False) -> Union[float, None]:
+        """
+        Get the first boundary after a point
+
+        Parameters:
+            point (float): point to search from
+            inclusive (bool): the point itself being a candidate
+
+        Returns:
+            (float/None): next boundary, or none if there is none
+        """
+
+        search = bisect_left if inclusive else bisect_right
+        candidates: list[float] = []
+        index: int = search(self._begins, point)
+        if index < len(self._begins):
+            candidates.append(self._begins[index])
+        index = search(self._ends, point)
+        if index < len(self._ends):
+            candidates.append(self._ends[index])
+        return min(candidates, default=None)
+
+    def previous_boundary(self, point: float) -> Union[float, None]:
+        """
+        Get the last boundary before a point
+
+        Parameters:
+            point (float): point to search from
+
+        Returns:
+            (float/None): previous boundary, or none if there is none
+        """
+
+        candidates: list[float] = []
+        index: int = bisect_left(self._begins, point)
+        if index > 0:
+            candidates.append(self._begins[index - 1])
+        index = bisect_left(self._ends, point)
+        if index > 0:
+            candidates.append(self._ends[index - 1])
+        return max(candidates, default=None)
+
+    def overlapping(self, point: float) -> list[Statement]:
+        """
+        Get the statements overlapping a boundary, i.e. the area from the boundary to the next one.
+        Statements with width overlapping it begin in [point - max_width, point]
+
+        Parameters:
+            point (float): boundary of the model
+
+        Returns:
+            (list[Statement]): overlapping statements
+        """
+
+        lower: int = bisect_left(self._begins, point - self._max_width)
+        upper: int = bisect_right(self._begins, point)
+        overlapping: list[Statement] = [st for st in self._by_begin[lower:upper] if point < st.end]
+        overlapping.extend(self._points[:bisect_right(self._point_begins, point)])
+        return overlapping
+
+    def __len__(self):
+        return len(self._by_begin)
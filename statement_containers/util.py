@@ -1,7 +1,11 @@
 import bisect
+from collections import deque
+from operator import itemgetter
+from typing import Union
 
-import solver.rules as rules
-from solver.constants import QUALITY_CONS
+import solver.kernels as kernels
+from solver.constants import ADD
+from solver.util import quality_add
 from statement_containers.statement import Statement
 
 
@@ -72,31 +76,59 @@ def init_boundaries(statements: set[Statement], overlap_map: dict[float, set[Sta
     return boundaries
 
 
+def sweep_right(overlapping: set[Statement], starting: list[Statement], ending: list[Statement]) -> set[Statement]:
+    """
+    Get the statements overlapping the next boundary, given the ones overlapping the previous boundary.
+    Statements without width keep overlapping all later boundaries, like in 'init_boundaries'
+
+    Parameters:
+        overlapping (set[Statement]): statements overlapping the previous boundary
+        starting (list[Statement]): statements beginning at the next boundary
+        ending (list[Statement]): statements with width ending at the next boundary
+
+    Returns:
+        (set[Statement]): overlapping statements
+    """
+
+    overlapping = overlapping.difference(ending)
+    overlapping.update(starting)
+    return overlapping
+
+
+def sweep_left(overlapping: set[Statement], starting: list[Statement], ending: list[Statement]) -> set[Statement]:
+    """
+    Get the statements overlapping the previous boundary, given the ones overlapping the next boundary
+
+    Parameters:
+        overlapping (set[Statement]): statements overlapping the next boundary
+        starting (list[Statement]): statements beginning at the next boundary
+        ending (list[Statement]): statements with width ending at the next boundary
+
+    Returns:
+        (set[Statement]): overlapping statements
+    """
+
+    overlapping = overlapping.difference(starting)
+    overlapping.update(ending)
+    return overlapping
+
+
 def strengthen_interval_height_sides(statements: list[Statement]):
     """
-    minimize height of statement using the (R) and (L) rules
+    minimize height of statement using the (R) and (L) rules. The rules are applied on the fields of 
+    the statements (see kernels.strengthen_sides), only changed statements are created again
 
     Parameters:
         statements (list[Statement]): statements to minimalize height of
     """
 
-    i: int = 0
-    while i < len(statements):
-        changed: bool = False
-        if i < len(statements) - 1:
-            result = rules.interval_strength_left(statements[i], statements[i + 1])
-            if result is not None:
-                statements[i + 1] = result
-                changed = True
-        if i > 0:
-            result = rules.interval_strength_right(statements[i - 1], statements[i])
-            if result is not None:
-                statements[i - 1] = result
-                changed = True
-        if changed:
-            i -= 1
-            continue
-        i += 1
+    if not statements:
+        return
+    begin, end, quality, begin_y, end_y = map(list, zip(*statements))
+    kernels.strengthen_sides(begin, end, quality, begin_y, end_y)
+    for i, st in enumerate(statements):
+        if st.begin_y != begin_y[i] or st.end_y != end_y[i]:
+            statements[i] = Statement(st.begin, st.end, st.quality, begin_y[i], end_y[i])
 
 
 def overlapping(statements: list[Statement], begin, end) -> tuple[int, int]:
@@ -111,7 +143,7 @@ def overlapping(statements: list[Statement], begin, end) -> tuple[int, int]:
         indices of start and end pos of overlapping statements, or (-1, -1) if none found
     """
 
-    index = bisect.bisect_left(statements, Statement(begin, begin, QUALITY_CONS, 0, 0))
+    index = bisect.bisect_left(statements, begin, key=itemgetter(0))
 
     lower = index
     if index > 0 and len(statements) > 0:
@@ -129,3 +161,165 @@ def overlapping(statements: list[Statement], begin, end) -> tuple[int, int]:
     if upper - lower < 0:
         return -1, -1
     return lower, upper + 1
+
+
+def build_sparse_table(values: list, combine) -> list[list]:
+    """
+    Build a sparse table over a list, allowing range queries of an associative and idempotent
+    operation (e.g. min, max or the quality addition) in constant time
+
+    Parameters:
+        values (list): values to build the table of
+        combine (callable): associative and idempotent function combining two values
+
+    Returns:
+        table (list[list]): levels of the table, level k combines 2^k consecutive values
+    """
+
+    table: list[list] = [list(values)]
+    width: int = 1
+    while 2 * width <= len(values):
+        previous: list = table[-1]
+        table.append([combine(previous[i], previous[i + width]) for i in range(len(previous) - width)])
+        width *= 2
+    return table
+
+
+def build_join_index(statements: list[Statement]) -> tuple:
+    """
+    Build an index over normalized statements, joining any range of them in constant time. Normalized 
+    statements are sorted and do not overlap, so their begins and ends are both sorted. The sparse tables 
+    form a hierarchy of coarsened models: level k holds the joins of 2^k adjacent statements
+
+    Parameters:
+        statements (list[Statement]): normalized statements
+
+    Returns:
+        (tuple): begins, ends, gap prefix sums and sparse tables (begin_y, end_y, quality) of the statements
+    """
+
+    begins: list[float] = [st.begin for st in statements]
+    ends: list[float] = [st.end for st in statements]
+    gaps: list[int] = [0]
+    for i in range(len(statements) - 1):
+        gaps.append(gaps[-1] + (1 if begins[i + 1] > ends[i] else 0))
+
+    return (begins, ends, gaps,
+            build_sparse_table([st.begin_y for st in statements], min),
+            build_sparse_table([st.end_y for st in statements], max),
+            build_sparse_table([st.quality for st in statements], quality_add))
+
+
+def join_range(index: tuple, lower: int, upper: int) -> Union[Statement, None]:
+    """
+    Join the normalized statements in the inclusive index range [lower, upper], equivalent to
+    using the join rule on them
+
+    Parameters:
+        index (tuple): index built by build_join_index
+        lower, upper (int): inclusive index range
+
+    Returns:
+        (Statement/None): joined statement, or none if the range is empty or has a gap
+    """
+
+    if upper < lower:
+        return None
+    begins, ends, gaps, begin_y, end_y, quality = index
+    if gaps[upper] - gaps[lower] > 0:
+        return None
+
+    return Statement(begins[lower], ends[upper], query_sparse_table(quality, lower, upper, quality_add),
+                     query_sparse_table(begin_y, lower, upper, min),
+                     query_sparse_table(end_y, lower, upper, max))
+
+
+def join_overlapping(index: tuple, begin: float, end: float) -> Union[Statement, None]:
+    """
+    Join the normalized statements overlapping an area
+
+    Parameters:
+        index (tuple): index built by build_join_index
+        begin, end (float): [begin, end] area
+
+    Returns:
+        (Statement/None): joined statement, or none if no statement overlaps or the statements have a gap
+    """
+
+    begins, ends = index[:2]
+    return join_range(index, bisect.bisect_left(ends, begin), bisect.bisect_right(begins, end) - 1)
+
+
+def query_sparse_table(table: list[list], begin: int, end: int, combine):
+    """
+    Combine the values in the inclusive index range [begin, end] using a sparse table
+
+    Parameters:
+        table (list[list]): table built by build_sparse_table
+        begin, end (int): inclusive index range
+        combine (callable): function used to build the table
+
+    Returns:
+        combined value of the range
+    """
+
+    level: int = (end - begin + 1).bit_length() - 1
+    return combine(table[level][begin], table[level][end - (1 << level) + 1])
+
+
+def sweep_joins(statements: list[Statement], windows: list[tuple[float, float]]) -> list[Union[Statement, None]]:
+    """
+    Join the normalized statements overlapping each of multiple areas in a single pass. The areas are 
+    sorted by begin and end, so the statements overlapping them form a sliding range. The bounds of 
+    the joined domain are kept in monotone deques and the qualities in the range are counted, so each 
+    statement is added and removed once
+
+    Parameters:
+        statements (list[Statement]): normalized statements
+        windows (list[tuple[float, float]]): [begin, end] areas, sorted by begin and end
+
+    Returns:
+        (list[Statement/None]): joined statement of each area, or none if no statement overlaps it or 
+            the statements have a gap
+    """
+
+    joins: list[Union[Statement, None]] = []
+    lower: int = 0
+    upper: int = 0  # the range is [lower, upper)
+    gaps: int = 0
+    lowest: deque[int] = deque()  # indices of increasing begin_y
+    highest: deque[int] = deque()  # indices of decreasing end_y
+    qualities: dict[str, int] = {}
+
+    for begin, end in windows:
+        while upper < len(statements) and statements[upper].begin <= end:
+            st: Statement = statements[upper]
+            if upper > lower and st.begin > statements[upper - 1].end:
+                gaps += 1
+            while lowest and statements[lowest[-1]].begin_y >= st.begin_y:
+                lowest.pop()
+            lowest.append(upper)
+            while highest and statements[highest[-1]].end_y <= st.end_y:
+                highest.pop()
+            highest.append(upper)
+            qualities[st.quality] = qualities.get(st.quality, 0) + 1
+            upper += 1
+
+        while lower < upper and statements[lower].end < begin:
+            st: Statement = statements[lower]
+            if lower + 1 < upper and statements[lower + 1].begin > st.end:
+                gaps -= 1
+            if lowest[0] == lower:
+                lowest.popleft()
+            if highest[0] == lower:
+                highest.popleft()
+            qualities[st.quality] -= 1
+            lower += 1
+
+        if lower == upper or gaps > 0:
+            joins.append(None)
+            continue
+        quality: str = kernels.fold_qualities(ADD, [q for q, count in qualities.items() if count > 0])
+        joins.append(Statement(statements[lower].begin, statements[upper - 1].end, quality,
+                               statements[lowest[0]].begin_y, statements[highest[0]].end_y))
+    return joins
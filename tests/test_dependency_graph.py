@@ -0,0 +1,25 @@
+from solver.dependency_graph import DependencyGraph
+from solver.solver import Solver
+
+
+def test_order_of_diamond_with_cross_edge():
+    """
+    a -> p -> q -> r -> b and a -> r: r is found before q by a bfs from a, but q influences r,
+    so r has to come first
+    """
+
+    graph: DependencyGraph = DependencyGraph()
+    for a, b in [(0, 1), (1, 2), (0, 3), (2, 3), (3, 4)]:
+        graph.add(a, b)
+
+    order: list[int] = graph.setup(0, 4).order
+    assert sorted(order) == [1, 2, 3]
+    for a, b in [(1, 2), (2, 3)]:
+        assert order.index(b) < order.index(a)
+
+
+def test_solve_diamond_with_cross_edge():
+    solver: Solver = Solver([("a", (0, 10), "mono", (0, 10), "p"), ("p", (0, 10), "mono", (0, 10), "q"),
+                             ("a", (0, 10), "mono", (0, 10), "r"), ("q", (0, 10), "mono", (0, 10), "r"),
+                             ("r", (0, 10), "mono", (0, 10), "b")])
+    assert solver.solve(("a", (0, 10), "mono", (0, 10), "b"))
@@ -0,0 +1,34 @@
+from solver.snapping import snap_statement
+from solver.solver import Solver
+from statement_containers.statement import Statement
+
+
+def accumulated_model(amount: int) -> list[tuple]:
+    """
+    Adjacent statements of width 0.1, with the begins accumulated like in build_model_from_csv
+    """
+
+    statements: list[tuple] = []
+    x: float = 0.0
+    for _ in range(amount):
+        statements.append(("a", (x, x + 0.1), "mono", (0, 1), "b"))
+        x += 0.1
+    return statements
+
+
+def test_accumulated_bounds_touch_after_snapping():
+    snapped: list[Statement] = [snap_statement(Statement(*statement[1], statement[2], *statement[3]), 0.1, 0.1)
+                                for statement in accumulated_model(30)]
+    for left, right in zip(snapped, snapped[1:]):
+        assert left.end == right.begin < right.end
+
+
+def test_accumulated_model_is_solved_after_snapping():
+    hypothesis: tuple = ("a", (0.25, 0.45), "mono", (0, 1), "b")
+    assert Solver(accumulated_model(30)).solve(hypothesis)
+    assert Solver(accumulated_model(30), snap=0.1).solve(hypothesis)
+
+
+def test_conservative_without_tolerance():
+    statement: Statement = snap_statement(Statement(0.20000000003, 0.5, "mono", 0.2, 0.30000000003), 0.1, 0.1, 0)
+    assert statement == (0.3, 0.5, "mono", 0.2, 0.4)
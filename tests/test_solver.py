@@ -0,0 +1,66 @@
+import random
+
+from solver.constants import QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB
+from solver.solver import Solver
+
+
+QUALITIES: list[str] = [QUALITY_MONO, QUALITY_ANTI, QUALITY_CONS, QUALITY_ARB]
+
+
+def random_model(rng: random.Random) -> tuple[list[tuple], list[tuple]]:
+    """
+    Create random statements between variables in a fixed order (so the model has no cycles) and 
+    random hypotheses on them
+    """
+
+    variables: list[str] = list("abcdef")[:rng.randint(2, 6)]
+    statements: list[tuple] = []
+    for i, a in enumerate(variables):
+        for b in variables[i + 1:]:
+            if rng.random() < 0.6:
+                for _ in range(rng.randint(1, 8)):
+                    x, y = rng.uniform(0, 10), rng.uniform(0, 10)
+                    statements.append((a, (round(x, 2), round(x + rng.uniform(0.5, 5), 2)), rng.choice(QUALITIES),
+                                       (round(y, 2), round(y + rng.uniform(0.5, 6), 2)), b))
+
+    hypotheses: list[tuple] = []
+    for _ in range(12):
+        a, b = sorted(rng.sample(range(len(variables)), 2))
+        x, y = rng.uniform(0, 10), rng.uniform(0, 8)
+        hypotheses.append((variables[a], (x, x + rng.uniform(0, 2)), rng.choice(QUALITIES),
+                           (y, y + rng.uniform(1, 10)), variables[b]))
+    return statements, hypotheses
+
+
+def test_results_do_not_depend_on_earlier_hypotheses():
+    rng: random.Random = random.Random(0)
+    for _ in range(150):
+        statements, hypotheses = random_model(rng)
+        fresh: list[bool] = [Solver(statements).solve(hypothesis) for hypothesis in hypotheses]
+        reused: Solver = Solver(statements)
+        assert [reused.solve(hypothesis) for hypothesis in hypotheses] == fresh
+        assert Solver(statements).solve_many(hypotheses) == fresh
+
+
+def test_sweep_proves_at_least_the_windows_of_solve():
+    rng: random.Random = random.Random(1)
+    for _ in range(50):
+        statements, hypotheses = random_model(rng)
+        a, _, quality, y_interval, b = hypotheses[0]
+        begin: float = rng.uniform(0, 5)
+        windows: list[tuple[float, float]] = [(begin + i * 0.5, begin + i * 0.5 + 1) for i in range(10)]
+        solved: list[bool] = [Solver(statements).solve((a, window, quality, y_interval, b)) for window in windows]
+        swept: list[bool] = Solver(statements).sweep(a, windows, quality, y_interval, b)
+        assert all(swept_window or not solved_window for swept_window, solved_window in zip(swept, solved))
+
+
+def test_sweep_strengthens_over_all_windows():
+    """
+    The segment [4, 6] is strengthened by its neighbour [3, 4] only when the spanning range is solved
+    """
+
+    statements: list[tuple] = [("a", (3, 6), "anti", (2, 6), "b"), ("a", (1, 4), "anti", (0, 3), "b")]
+    windows: list[tuple[float, float]] = [(3, 4), (4, 5), (5, 6), (6, 7)]
+    assert Solver(statements).sweep("a", windows, "anti", (1, 5), "b") == [False, True, True, False]
+    assert [Solver(statements).solve(("a", window, "anti", (1, 5), "b")) for window in windows] == \
+        [False, True, False, False]